@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+'''Compare the JSON backends on a large synthetic pod list'''
+
+__author__ = 'pjs7678@pjs7678'
+
+import getopt
+import sys
+import time
+import kubernetes
+from kubernetes._json_backend import _GetJsonBackend
+
+USAGE = '''Usage: benchmarkJson.py [options]
+
+  This script times decoding and encoding a synthetic PodList with every
+  JSON backend installed (see kubernetes.GetJsonBackends()).
+
+  Options:
+
+    -h --help : print this help
+    --pods : the number of pods in the list, defaults to 20000
+    --rounds : the number of timed rounds per backend, defaults to 3
+'''
+
+def PrintUsageAndExit():
+  print USAGE
+  sys.exit(2)
+
+def MakePod(i):
+  return {
+    'kind': 'Pod',
+    'id': 'pod-%d' % i,
+    'uid': '6e1a7f3c-%08d' % i,
+    'namespace': 'default',
+    'resourceVersion': i,
+    'creationTimestamp': '2014-10-25T10:00:00Z',
+    'labels': {'name': 'app-%d' % (i % 50), 'tier': 'frontend'},
+    'desiredState': {
+      'manifest': {
+        'version': 'v1beta1',
+        'id': 'pod-%d' % i,
+        'containers': [{
+          'name': 'web',
+          'image': 'nginx',
+          'memory': 134217728,
+          'cpu': 100,
+          'ports': [{'containerPort': 80, 'protocol': 'TCP'}],
+          'env': [{'name': 'MODE', 'value': 'production'}]}]}},
+    'currentState': {
+      'status': 'Running',
+      'host': 'minion-%d' % (i % 100),
+      'hostIP': '10.240.0.%d' % (i % 100),
+      'podIP': '10.244.%d.%d' % (i / 250 % 250, i % 250),
+      'info': {'web': {'state': {'running': {'startedAt': '2014-10-25T10:00:05Z'}},
+                       'restartCount': 0,
+                       'image': 'nginx'}}}}
+
+def Time(func, rounds):
+  best = None
+  for _ in range(rounds):
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    if best is None or elapsed < best:
+      best = elapsed
+  return best
+
+def main():
+  try:
+    opts, args = getopt.gnu_getopt(sys.argv[1:], 'h', ['help', 'pods=', 'rounds='])
+  except getopt.GetoptError:
+    PrintUsageAndExit()
+  pods = 20000
+  rounds = 3
+  for o, a in opts:
+    if o in ('-h', '--help'):
+      PrintUsageAndExit()
+    if o in ('--pods'):
+      pods = int(a)
+    if o in ('--rounds'):
+      rounds = int(a)
+
+  stdlib = _GetJsonBackend('json')
+  data = {'kind': 'PodList', 'items': [MakePod(i) for i in range(pods)]}
+  text = stdlib.dumps(data)
+  pod_list = kubernetes.PodList.NewFromJsonDict(data)
+  as_dict = dict(pod_list.AsDict().items() + kubernetes.TypeMeta.AsDict(pod_list).items())
+
+  print '%d pods, %.1f MB of JSON, best of %d rounds' % (pods, len(text) / 1e6, rounds)
+  print '%-12s %10s %10s' % ('backend', 'loads (s)', 'dumps (s)')
+  for name in kubernetes.GetJsonBackends():
+    backend = _GetJsonBackend(name)
+    loads = Time(lambda: backend.loads(text), rounds)
+    dumps = Time(lambda: backend.dumps(as_dict, sort_keys=True), rounds)
+    print '%-12s %10.3f %10.3f' % (name, loads, dumps)
+
+if __name__ == "__main__":
+  main()
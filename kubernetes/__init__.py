@@ -19,7 +19,11 @@
 __author__ = 'pjs7678@pjs7678'
 __version__ = '0.1'
 
-import json as simplejson
+from _json_backend import _GetJsonBackend, _GetCompatibleJsonBackend, GetJsonBackends
+
+# Models are encoded with the fastest backend writing the same text as the
+# json module, so that AsJsonString does not depend on what is installed
+simplejson = _GetCompatibleJsonBackend()
 
 try:
 	from hashlib import md5
@@ -27,6 +31,8 @@ except ImportError:
 	from md5 import md5
 
 from _file_cache import _FileCache
+from _memory_cache import _MemoryCache
+from _sqlite_cache import _SqliteCache
 from error import KubernetesError
 
 from action import EnvVar, HTTPGetAction, TCPSocketAction, ExecAction, LivenessProbe
@@ -39,5 +45,14 @@ from service import Service, Endpoints, ServiceList, EndpointsList
 from minion import NodeResources, Minion, Binding, MinionList
 from status import StatusDetails, StatusCause, Status
 from event import ObjectReference, Event, ServerOp, EventList, ServerOpList
+from columns import PodColumns, MinionColumns, EventColumns
+from selector import LabelSelector, LabelIndex, GroupBySelector
+from snapshot import ClusterSnapshot
+from retry import RetryPolicy, RetryBudget
+from ratelimit import RateLimiter
 
 from api import Api
+from async_api import AsyncApi
+from store import Store, PodStore
+from informer import Informer
+from multicluster import MultiClusterApi, MultiClusterResult
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Codecs used to compress cache entries.
+
+A compressed entry is stored as MAGIC, the codec name, a NUL byte and the
+compressed payload.  Anything else is a raw entry, so caches written
+before compression was enabled stay readable, and an entry can be
+decoded whatever codec the reading cache is configured with, as long as
+the codec it was written with is installed.  _Decompress raises
+_CompressionError for entries it cannot decode, which the caches treat
+as misses.
+'''
+
+import zlib
+
+try:
+  import lzma
+except ImportError:
+  try:
+    from backports import lzma
+  except ImportError:
+    lzma = None
+
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
+MAGIC = '\x00KZ'
+
+class _CompressionError(Exception):
+  '''Base exception class for cache compression related errors'''
+
+class _ZlibCodec(object):
+  name = 'zlib'
+
+  def __init__(self, level=6):
+    self._level = level
+
+  def Compress(self, data):
+    return zlib.compress(data, self._level)
+
+  def Decompress(self, data):
+    return zlib.decompress(data)
+
+class _LzmaCodec(object):
+  name = 'lzma'
+
+  def __init__(self, preset=6):
+    if lzma is None:
+      raise _CompressionError('lzma is not available')
+    self._preset = preset
+
+  def Compress(self, data):
+    return lzma.compress(data, preset=self._preset)
+
+  def Decompress(self, data):
+    return lzma.decompress(str(data))
+
+class _ZstdCodec(object):
+  name = 'zstd'
+
+  def __init__(self, level=3):
+    if zstandard is None:
+      raise _CompressionError('zstandard is not available')
+    self._compressor = zstandard.ZstdCompressor(level=level)
+    self._decompressor = zstandard.ZstdDecompressor()
+
+  def Compress(self, data):
+    return self._compressor.compress(data)
+
+  def Decompress(self, data):
+    return self._decompressor.decompress(str(data))
+
+CODECS = {
+  'zlib': _ZlibCodec,
+  'lzma': _LzmaCodec,
+  'zstd': _ZstdCodec}
+
+def _GetCodec(codec):
+  '''Return a codec instance for a codec name, instance or None.'''
+  if codec is None or hasattr(codec, 'Compress'):
+    return codec
+  if codec not in CODECS:
+    raise _CompressionError('unknown codec %s' % codec)
+  return CODECS[codec]()
+
+def _Compress(codec, threshold, data):
+  '''Encode data for storage, compressing it if it is at least threshold
+  bytes long and a codec is given.'''
+  if codec is not None and len(data) >= threshold:
+    return '%s%s\x00%s' % (MAGIC, codec.name, codec.Compress(data))
+  if data.startswith(MAGIC):
+    # Keep raw data that looks like a compressed entry unambiguous
+    return '%sraw\x00%s' % (MAGIC, data)
+  return data
+
+_decoders = {}
+
+def _Decompress(data, codec=None):
+  '''Decode an entry written by _Compress.
+
+  data may be a str or an mmap; raw entries are returned unchanged.
+  Entries named after codec, the reading cache's own codec, are decoded
+  with it, so custom codecs can read back what they wrote; any other
+  name is looked up in CODECS.
+  Raises _CompressionError if the entry is corrupt or its codec is not
+  available.
+  '''
+  if data[:len(MAGIC)] != MAGIC:
+    return data
+  end = data.find('\x00', len(MAGIC))
+  if end < 0:
+    raise _CompressionError('truncated cache entry')
+  name = data[len(MAGIC):end]
+  payload = buffer(data, end + 1)
+  if name == 'raw':
+    return str(payload)
+  if codec is not None and name == codec.name:
+    decoder = codec
+  else:
+    if name not in _decoders:
+      _decoders[name] = _GetCodec(name)
+    decoder = _decoders[name]
+  try:
+    return decoder.Decompress(payload)
+  except Exception as e:
+    raise _CompressionError('cannot decompress %s cache entry: %s' % (name, e))
@@ -15,25 +15,91 @@
 # limitations under the License.
 
 from hashlib import md5
+import mmap
 import os
 import tempfile
+import threading
+import time
+
+from kubernetes._compression import _GetCodec, _Compress, _Decompress, _CompressionError
 
 class _FileCacheError(Exception):
   '''Base exception class for FileCache related errors'''
 
 class _FileCache(object):
+  '''A cache storing one file per key under a hashed directory fan-out.
+
+  By default the cache grows without bound.  Give max_bytes and/or
+  max_entries to cap its size and max_age to expire entries some seconds
+  after they were written.  Every compact_every writes a compaction pass
+  removes expired entries and then evicts the least recently read ones
+  until the cache fits its limits again; Compact() runs one on demand.
+  Entries of at least compress_threshold bytes are compressed with codec
+  ('zlib', 'lzma', 'zstd' or any object with a name and Compress/Decompress
+  methods) when one is given; smaller entries are stored raw.  Entries of a
+  custom codec are only readable by caches configured with that codec.
+  '''
 
   DEPTH = 3
 
-  def __init__(self,root_directory=None):
+  def __init__(self,root_directory=None, max_bytes=None, max_entries=None,
+               max_age=None, compact_every=100, codec=None,
+               compress_threshold=4096):
     self._InitializeRootDirectory(root_directory)
+    self._codec = _GetCodec(codec)
+    self._compress_threshold = compress_threshold
+    self._max_bytes = max_bytes
+    self._max_entries = max_entries
+    self._max_age = max_age
+    self._compact_every = compact_every
+    self._writes = 0
+    self._compact_lock = threading.Lock()
 
   def Get(self, key):
+    return self._Read(key, self._ReadFile)
+
+  def GetMapped(self, key):
+    '''Like Get, but return a read-only mmap of the entry instead of a copy.
+
+    The mapping supports slicing, find() and buffer(), so callers can look
+    at part of a large entry without reading the rest of it into memory.
+    The file is unmapped once the last reference to the mapping is gone.
+    '''
+    return self._Read(key, self._MapFile)
+
+  def _Read(self, key, reader):
     path = self._GetPath(key)
-    if os.path.exists(path):
-      return open(path).read()
-    else:
+    try:
+      mtime = os.path.getmtime(path)
+    except OSError:
+      return None
+    now = time.time()
+    if self._max_age is not None and now - mtime > self._max_age:
+      self._RemovePath(path)
+      return None
+    try:
+      data = reader(path)
+      # Record the read in atime (keeping mtime, the cached time) so that
+      # eviction is least recently used even on noatime mounts.
+      os.utime(path, (now, mtime))
+    except (IOError, OSError):
+      return None
+    except _CompressionError:
+      # Corrupt, or written with a codec missing here: a miss
+      self._RemovePath(path)
       return None
+    return data
+
+  def _ReadFile(self, path):
+    with open(path, 'rb') as f:
+      return _Decompress(f.read(), self._codec)
+
+  def _MapFile(self, path):
+    with open(path, 'rb') as f:
+      if os.fstat(f.fileno()).st_size == 0:
+        # Empty files cannot be mapped
+        return ''
+      return _Decompress(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), self._codec)
 
   def Set(self, key, data):
     path = self._GetPath(key)
@@ -42,8 +108,9 @@ class _FileCache(object):
       os.makedirs(directory)
     if not os.path.isdir(directory):
       raise _FileCacheError('%s exists but is not a directory' % directory)
+    data = _Compress(self._codec, self._compress_threshold, data)
     temp_fd, temp_path = tempfile.mkstemp()
-    temp_fp = os.fdopen(temp_fd, 'w')
+    temp_fp = os.fdopen(temp_fd, 'wb')
     temp_fp.write(data)
     temp_fp.close()
     if not path.startswith(self._root_directory):
@@ -52,6 +119,9 @@ class _FileCache(object):
     if os.path.exists(path):
       os.remove(path)
     os.rename(temp_path, path)
+    self._writes += 1
+    if self._IsBounded() and self._writes % self._compact_every == 0:
+      self.Compact()
 
   def Remove(self, key):
     path = self._GetPath(key)
@@ -68,6 +138,72 @@ class _FileCache(object):
     else:
       return None
 
+  def Compact(self):
+    '''Expire old entries and evict the least recently read ones.
+
+    Returns:
+      The number of entries removed.
+    '''
+    if not self._compact_lock.acquire(False):
+      # Another thread is already compacting
+      return 0
+    try:
+      return self._Compact()
+    finally:
+      self._compact_lock.release()
+
+  def _Compact(self):
+    now = time.time()
+    removed = 0
+    entries = []
+    total_bytes = 0
+    for directory, _, filenames in os.walk(self._root_directory):
+      for filename in filenames:
+        path = os.path.join(directory, filename)
+        try:
+          st = os.stat(path)
+        except OSError:
+          continue
+        if self._max_age is not None and now - st.st_mtime > self._max_age:
+          removed += self._RemovePath(path)
+          continue
+        entries.append((st.st_atime, st.st_size, path))
+        total_bytes += st.st_size
+
+    entries.sort()
+    count = len(entries)
+    for atime, size, path in entries:
+      if (self._max_entries is None or count <= self._max_entries) and \
+         (self._max_bytes is None or total_bytes <= self._max_bytes):
+        break
+      removed += self._RemovePath(path)
+      count -= 1
+      total_bytes -= size
+
+    self._RemoveEmptyDirectories()
+    return removed
+
+  def _IsBounded(self):
+    return self._max_bytes is not None or \
+           self._max_entries is not None or \
+           self._max_age is not None
+
+  def _RemovePath(self, path):
+    try:
+      os.remove(path)
+      return 1
+    except OSError:
+      return 0
+
+  def _RemoveEmptyDirectories(self):
+    for directory, subdirectories, filenames in \
+        os.walk(self._root_directory, topdown=False):
+      if directory != self._root_directory and not os.listdir(directory):
+        try:
+          os.rmdir(directory)
+        except OSError:
+          pass
+
   def _GetUsername(self):
     '''Attempt to find the username in a cross-platform fashion.'''
     try:
@@ -81,7 +217,8 @@ class _FileCache(object):
 
   def _GetTmpCachePath(self):
     username = self._GetUsername()
-    cache_directory = 'python.cache_' + username
+    # Not shared with other tools, whose files compaction would delete
+    cache_directory = 'python-kubernetes.cache_' + username
     return os.path.join(tempfile.gettempdir(), cache_directory)
 
   def _InitializeRootDirectory(self, root_directory):
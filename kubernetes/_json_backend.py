@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Interchangeable JSON encoders and decoders.
+
+Every backend offers loads(s) and dumps(obj, sort_keys=False).  Any other
+attribute (JSONDecoder, load, dump, ...) is looked up on the standard
+library json module, so a backend can stand in wherever the json module
+is used.  Backends whose library has an incremental decoder (simplejson)
+offer it as JSONDecoder instead; the streaming list methods use it.
+'''
+
+import json
+
+class _JsonBackend(object):
+	'''A JSON backend built around third party loads/dumps functions.'''
+	def __init__(self, name, loads, dumps, decoder_class=None):
+		self.name = name
+		self.loads = loads
+		self._dumps = dumps
+		if decoder_class is not None:
+			self.JSONDecoder = decoder_class
+
+	def dumps(self, obj, sort_keys=False):
+		return self._dumps(obj, sort_keys)
+
+	def __getattr__(self, name):
+		return getattr(json, name)
+
+	def __repr__(self):
+		return '<JSON backend %s>' % self.name
+
+def _NewOrjsonBackend():
+	import orjson
+	def dumps(obj, sort_keys):
+		option = orjson.OPT_SORT_KEYS if sort_keys else 0
+		return orjson.dumps(obj, option=option).decode('utf-8')
+	return _JsonBackend('orjson', orjson.loads, dumps)
+
+def _NewUjsonBackend():
+	import ujson
+	def dumps(obj, sort_keys):
+		return ujson.dumps(obj, sort_keys=sort_keys, escape_forward_slashes=False)
+	return _JsonBackend('ujson', ujson.loads, dumps)
+
+def _NewRapidjsonBackend():
+	import rapidjson
+	def dumps(obj, sort_keys):
+		return rapidjson.dumps(obj, sort_keys=sort_keys)
+	return _JsonBackend('rapidjson', rapidjson.loads, dumps)
+
+def _NewSimplejsonBackend():
+	import simplejson
+	if not simplejson._speedups:
+		# Without its C speedups simplejson is slower than json
+		raise ImportError('simplejson C speedups are not available')
+	def dumps(obj, sort_keys):
+		return simplejson.dumps(obj, sort_keys=sort_keys)
+	return _JsonBackend('simplejson', simplejson.loads, dumps, simplejson.JSONDecoder)
+
+def _NewJsonBackend():
+	def dumps(obj, sort_keys):
+		return json.dumps(obj, sort_keys=sort_keys)
+	return _JsonBackend('json', json.loads, dumps)
+
+# Backend factories, fastest first.
+BACKENDS = [
+	('orjson', _NewOrjsonBackend),
+	('ujson', _NewUjsonBackend),
+	('rapidjson', _NewRapidjsonBackend),
+	('simplejson', _NewSimplejsonBackend),
+	('json', _NewJsonBackend)]
+
+# Backends whose dumps writes the same text as the json module, with ', '
+# and ': ' separators; the others write compact JSON.
+COMPATIBLE_BACKENDS = ('simplejson', 'json')
+
+_backends = {}
+
+def _GetJsonBackend(name=None):
+	'''Return the JSON backend called name, or the fastest available one.
+
+	Args:
+	  name:
+	  	One of 'orjson', 'ujson', 'rapidjson', 'simplejson' or 'json'.
+		If None, the first of these that can be imported is used; 'json'
+		is always available.  A backend instance is returned unchanged.
+
+	Raises:
+	  ValueError if the named backend is unknown or cannot be imported.
+	'''
+	if isinstance(name, _JsonBackend):
+		return name
+	if name is None:
+		for candidate, _ in BACKENDS:
+			try:
+				return _GetJsonBackend(candidate)
+			except ValueError:
+				continue
+	if name not in _backends:
+		factories = dict(BACKENDS)
+		if name not in factories:
+			raise ValueError('unknown JSON backend %s' % name)
+		try:
+			_backends[name] = factories[name]()
+		except (ImportError, AttributeError), e:
+			raise ValueError('JSON backend %s is not available: %s' % (name, e))
+	return _backends[name]
+
+def _GetCompatibleJsonBackend():
+	'''Return the fastest available backend of COMPATIBLE_BACKENDS.'''
+	for name in COMPATIBLE_BACKENDS:
+		try:
+			return _GetJsonBackend(name)
+		except ValueError:
+			continue
+
+def GetJsonBackends():
+	'''Return the names of the JSON backends that can be used here.'''
+	available = []
+	for name, _ in BACKENDS:
+		try:
+			_GetJsonBackend(name)
+		except ValueError:
+			continue
+		available.append(name)
+	return available
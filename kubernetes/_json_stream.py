@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Incremental decoding of the item array of a JSON list response.'''
+
+import re
+
+from kubernetes import simplejson
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+class _JsonStream(object):
+	'''Decodes consecutive JSON values from an iterable of string chunks,
+	only ever holding the unconsumed part of the input in memory.
+	'''
+	def __init__(self, chunks, decoder=None):
+		self._chunks = iter(chunks)
+		self._buffer = ''
+		self._pos = 0
+		self._eof = False
+		self._decoder = decoder or simplejson.JSONDecoder()
+
+	def Peek(self):
+		'''Return the next non-whitespace character, or None at the end.'''
+		while True:
+			self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+			if self._pos < len(self._buffer):
+				return self._buffer[self._pos]
+			if not self._Fill():
+				return None
+
+	def Expect(self, characters):
+		'''Consume and return the next character, which must be one of characters.'''
+		c = self.Peek()
+		if c is None or c not in characters:
+			raise ValueError('expected one of %r at offset %d, got %r' %
+				(characters, self._pos, c))
+		self._pos += 1
+		return c
+
+	def Decode(self):
+		'''Decode and return the next complete JSON value.'''
+		self.Peek()
+		while True:
+			try:
+				value, end = self._decoder.raw_decode(self._buffer, self._pos)
+			except ValueError:
+				if not self._Fill():
+					raise
+				continue
+			# A number running up to the end of the buffer may continue
+			# in the next chunk
+			if end < len(self._buffer) or not self._Fill():
+				self._pos = end
+				return value
+
+	def _Fill(self):
+		if self._eof:
+			return False
+		for chunk in self._chunks:
+			if chunk:
+				self._buffer = self._buffer[self._pos:] + chunk
+				self._pos = 0
+				return True
+		self._eof = True
+		return False
+
+def _IterJsonArray(chunks, key='items', decoder=None):
+	'''Yield the elements of the array stored under key in a top-level JSON
+	object, decoding each one as soon as it has been received.
+
+	Members other than key are decoded and skipped.  decoder needs a
+	raw_decode(s, idx) method, such as a JSONDecoder of a JSON backend;
+	it defaults to that of kubernetes.simplejson, i.e. simplejson's when
+	it is installed with its C speedups and the json module's otherwise.
+	Raises ValueError if the input is not valid JSON.
+	'''
+	stream = _JsonStream(chunks, decoder)
+	stream.Expect('{')
+	if stream.Peek() == '}':
+		return
+	while True:
+		name = stream.Decode()
+		stream.Expect(':')
+		if name == key and stream.Peek() == '[':
+			stream.Expect('[')
+			if stream.Peek() == ']':
+				stream.Expect(']')
+			else:
+				while True:
+					yield stream.Decode()
+					if stream.Expect(',]') == ']':
+						break
+		else:
+			stream.Decode()
+		if stream.Expect(',}') == '}':
+			return
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Helpers for decoding nested model objects on first access.'''
+
+class _Unparsed(object):
+	'''A JSON value whose model object has not been built yet.'''
+	__slots__ = ('data', 'decode', 'kwargs')
+
+	def __init__(self, data, decode, **kwargs):
+		self.data = data
+		self.decode = decode
+		self.kwargs = kwargs
+
+class _LazyAttribute(object):
+	'''Wraps the slot of a model attribute so that an _Unparsed value stored
+	in it is decoded, and stored back, the first time it is read.
+	'''
+	def __init__(self, slot):
+		self._slot = slot
+
+	def __get__(self, obj, objtype=None):
+		if obj is None:
+			return self
+		value = self._slot.__get__(obj, objtype)
+		if type(value) is _Unparsed:
+			value = value.decode(value.data, **value.kwargs)
+			self._slot.__set__(obj, value)
+		return value
+
+	def __set__(self, obj, value):
+		self._slot.__set__(obj, value)
+
+def _MakeLazy(cls, *names):
+	'''Let the named slot attributes of cls hold _Unparsed values.'''
+	for name in names:
+		setattr(cls, name, _LazyAttribute(cls.__dict__[name]))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import threading
+import time
+
+class _MemoryCache(object):
+  '''An in-process LRU cache with the same API as _FileCache.
+
+  Entries are bounded both by count and by total size in bytes; the least
+  recently used entries are evicted first.  When a backend cache (usually a
+  _FileCache) is given, every Set and Remove is written through to it and
+  misses are filled from it, so hot keys never touch the filesystem.
+
+  Values need not be strings: pass sizeof=None to only bound the entry
+  count, or any callable returning the size of a value in bytes.
+  '''
+
+  def __init__(self, backend=None, max_entries=256, max_bytes=64 * 1024 * 1024,
+               ttl=None, sizeof=len):
+    self._backend = backend
+    self._sizeof = sizeof or (lambda data: 0)
+    self._max_entries = max_entries
+    self._max_bytes = max_bytes
+    self._ttl = ttl
+    self._entries = OrderedDict()
+    self._bytes = 0
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+
+  def Get(self, key):
+    with self._lock:
+      entry = self._entries.pop(key, None)
+      if entry is not None:
+        data, cached_time, expires = entry
+        if expires is None or expires > time.time():
+          self._entries[key] = entry
+          self._hits += 1
+          return data
+        self._bytes -= self._sizeof(data)
+      self._misses += 1
+    if self._backend is None:
+      return None
+    data = self._backend.Get(key)
+    if data is not None:
+      self._Store(key, data, self._backend.GetCachedTime(key), self._ttl)
+    return data
+
+  def GetMapped(self, key):
+    '''Return the entry from memory, or else mapped from the backend.
+
+    Entries read through the backend's GetMapped are not promoted into
+    memory, so large cached bodies stay in the page cache only.
+    '''
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and (entry[2] is None or entry[2] > time.time()):
+        del self._entries[key]
+        self._entries[key] = entry
+        self._hits += 1
+        return entry[0]
+    if self._backend is None or not hasattr(self._backend, 'GetMapped'):
+      return self.Get(key)
+    with self._lock:
+      self._misses += 1
+    return self._backend.GetMapped(key)
+
+  def Set(self, key, data, ttl=None):
+    '''Store data under key, writing it through to the backend.
+
+    Args:
+      ttl:
+        Seconds this entry may stay in memory.  Defaults to the ttl given
+        to the constructor; None keeps it until evicted.
+    '''
+    if self._backend is not None:
+      self._backend.Set(key, data)
+    if ttl is None:
+      ttl = self._ttl
+    self._Store(key, data, time.time(), ttl)
+
+  def Remove(self, key):
+    with self._lock:
+      entry = self._entries.pop(key, None)
+      if entry is not None:
+        self._bytes -= self._sizeof(entry[0])
+    if self._backend is not None:
+      self._backend.Remove(key)
+
+  def GetCachedTime(self, key):
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        return entry[1]
+    if self._backend is not None:
+      return self._backend.GetCachedTime(key)
+    return None
+
+  def GetStats(self):
+    '''Return a dict of hit, miss and eviction counters and current usage.'''
+    with self._lock:
+      return {'hits': self._hits,
+              'misses': self._misses,
+              'evictions': self._evictions,
+              'entries': len(self._entries),
+              'bytes': self._bytes}
+
+  def _Store(self, key, data, cached_time, ttl):
+    size = self._sizeof(data)
+    with self._lock:
+      old = self._entries.pop(key, None)
+      if old is not None:
+        self._bytes -= self._sizeof(old[0])
+      if size > self._max_bytes:
+        # Too large to keep in memory at all; the backend still has it
+        return
+      expires = None
+      if ttl is not None:
+        expires = time.time() + ttl
+      self._entries[key] = (data, cached_time, expires)
+      self._bytes += size
+      while len(self._entries) > self._max_entries or \
+            self._bytes > self._max_bytes:
+        evicted_key, evicted = self._entries.popitem(last=False)
+        self._bytes -= self._sizeof(evicted[0])
+        self._evictions += 1
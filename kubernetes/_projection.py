@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Projection of parsed JSON objects onto a set of field paths.'''
+
+def _BuildTree(paths):
+	'''Turn ['id', 'currentState.host'] into {'id': None, 'currentState': {'host': None}}.
+
+	None marks a field that is kept whole.  A path that is a prefix of
+	another one wins, so ['labels', 'labels.name'] keeps all labels.
+	'''
+	tree = {}
+	for path in paths:
+		node = tree
+		names = path.split('.')
+		for name in names[:-1]:
+			child = node.get(name, {})
+			if child is None:
+				break
+			node[name] = child
+			node = child
+		else:
+			node[names[-1]] = None
+	return tree
+
+def _Project(data, tree):
+	if isinstance(data, list):
+		return [_Project(item, tree) for item in data]
+	if not isinstance(data, dict):
+		return data
+	projected = {}
+	for (name, subtree) in tree.iteritems():
+		if name in data:
+			value = data[name]
+			if subtree is not None:
+				value = _Project(value, subtree)
+			projected[name] = value
+	return projected
+
+def _CompileProjection(paths):
+	'''Return a function that copies a JSON object keeping only paths.
+
+	Args:
+	  paths:
+	  	A list of dotted field paths such as 'currentState.host'.  A path
+		running through a list applies to every element of the list, so
+		'desiredState.manifest.containers.image' keeps the image of every
+		container.  Missing fields are left out of the result.
+	'''
+	tree = _BuildTree(paths)
+	return lambda data: _Project(data, tree)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Declarative field schemas for the model classes.
+
+Each model lists its fields in a _FIELDS tuple, built with the helpers
+below, and is passed to _CompileModel once defined.  _CompileModel writes
+the source of a NewFromJsonDict and an AsDict specialised for exactly
+those fields, as straight-line code without loops over parameter
+defaults or keyword arguments, compiles it and installs it on the class.
+
+NewFromJsonDict decodes the fields of the class and all of its bases;
+AsDict encodes the fields declared on the class itself, as the
+AsJsonString methods add those of the bases.  _CompileModel also installs
+__getstate__ and __setstate__, without which Python 2 cannot pickle
+classes with __slots__.
+'''
+
+from kubernetes._lazy import _Unparsed, _MakeLazy
+
+VALUE, VALUE_LIST, MODEL, MODEL_LIST, MODEL_MAP = range(5)
+
+class _Field(object):
+	'''One attribute of a model and the JSON key it is stored under.'''
+	__slots__ = ('attr', 'key', 'kind', 'model', 'default', 'lazy')
+
+	def __init__(self, attr, key, kind=VALUE, model=None, default=None, lazy=False):
+		self.attr = attr
+		self.key = key
+		self.kind = kind
+		self.model = model
+		self.default = default
+		self.lazy = lazy
+
+def _Value(attr, key, default=None):
+	'''A plain JSON value (string, number, bool, or a dict kept as is).'''
+	return _Field(attr, key, VALUE, default=default)
+
+def _ValueList(attr, key):
+	'''A list of plain JSON values, copied on decode.'''
+	return _Field(attr, key, VALUE_LIST)
+
+def _Model(attr, key, model, lazy=False):
+	'''A nested object decoded into the model class named model.
+
+	With lazy=True the object is decoded on first access when the
+	containing object was decoded with lazy=True.
+	'''
+	return _Field(attr, key, MODEL, model=model, lazy=lazy)
+
+def _ModelList(attr, key, model, lazy=False):
+	'''A list of objects decoded into the model class named model.'''
+	return _Field(attr, key, MODEL_LIST, model=model, lazy=lazy)
+
+def _ModelMap(attr, key, model, lazy=False):
+	'''A dict whose values are decoded into the model class named model.'''
+	return _Field(attr, key, MODEL_MAP, model=model, lazy=lazy)
+
+# The globals of all generated functions; _CompileModel adds every model
+# class to it so that generated code can refer to models by name.
+_namespace = {'_new': object.__new__, '_Unparsed': _Unparsed}
+
+_DECODE_TEMPLATES = {
+	VALUE_LIST: 'list(value)',
+	MODEL: '%(model)s.NewFromJsonDict(value, lazy)',
+	MODEL_LIST: '[%(model)s.NewFromJsonDict(item, lazy) for item in value]',
+	MODEL_MAP: 'dict([(key, %(model)s.NewFromJsonDict(item, lazy)) for (key, item) in value.iteritems()])'}
+
+_ENCODE_TEMPLATES = {
+	VALUE: 'value',
+	VALUE_LIST: 'value',
+	MODEL: 'value.AsDict()',
+	MODEL_LIST: '[item.AsDict() for item in value]',
+	MODEL_MAP: 'dict([(key, item.AsDict()) for (key, item) in value.iteritems()])'}
+
+_DECODE_DOC = '''Create a new instance base on a JSON dict
+		Args:
+		  data: A JSON dict, as converted from the JSON in the kubernetes API
+		  lazy: If True, nested objects are decoded on first access
+		Returns:
+		  A kubernetes.%s instance
+		'''
+
+_ENCODE_DOC = ''' A dic representation of this kubernetes.%s instance.
+
+		The return values uses the same key names as the JSON representation.
+
+		Returns:
+		  A dict representing this kubernetes.%s instance
+		'''
+
+def _GenerateDecoder(cls, fields):
+	name = cls.__name__
+	lines = [
+		'def NewFromJsonDict(data, lazy=False):',
+		'\tget = data.get',
+		'\tobj = _new(%s)' % name]
+	for field in fields:
+		if field.kind == VALUE:
+			lines.append('\tobj.%s = get(%r, %r)' % (field.attr, field.key, field.default))
+			continue
+		decode = _DECODE_TEMPLATES[field.kind] % {'model': field.model}
+		lines.append('\tvalue = get(%r)' % field.key)
+		lines.append('\tif value is None:')
+		lines.append('\t\tobj.%s = None' % field.attr)
+		if field.lazy:
+			helper = '_Decode%s%s' % (name, field.attr)
+			lines[:0] = [
+				'def %s(value, lazy=False):' % helper,
+				'\treturn %s' % decode,
+				'']
+			lines.append('\telif lazy:')
+			lines.append('\t\tobj.%s = _Unparsed(value, %s, lazy=True)' % (field.attr, helper))
+		lines.append('\telse:')
+		lines.append('\t\tobj.%s = %s' % (field.attr, decode))
+	lines.append('\treturn obj')
+	return '\n'.join(lines)
+
+def _GenerateEncoder(cls, fields):
+	lines = [
+		'def AsDict(self):',
+		'\tdata = {}']
+	for field in fields:
+		lines.append('\tvalue = self.%s' % field.attr)
+		lines.append('\tif value:')
+		lines.append('\t\tdata[%r] = %s' % (field.key, _ENCODE_TEMPLATES[field.kind]))
+	lines.append('\treturn data')
+	return '\n'.join(lines)
+
+def _GetState(self):
+	'''Return the slot values of a model, decoding any lazy ones.'''
+	state = {}
+	for klass in type(self).__mro__:
+		for name in klass.__dict__.get('__slots__', ()):
+			try:
+				state[name] = getattr(self, name)
+			except AttributeError:
+				pass
+	return state
+
+def _SetState(self, state):
+	for (name, value) in state.iteritems():
+		setattr(self, name, value)
+
+def _CompileModel(cls):
+	'''Install NewFromJsonDict and AsDict on cls, generated from _FIELDS,
+	and the pickling support of its slots.'''
+	fields = []
+	for base in reversed(cls.__mro__):
+		fields.extend(base.__dict__.get('_FIELDS', ()))
+	own_fields = cls.__dict__.get('_FIELDS', ())
+
+	_namespace[cls.__name__] = cls
+	source = '%s\n\n%s\n' % (_GenerateDecoder(cls, fields), _GenerateEncoder(cls, own_fields))
+	code = compile(source, '<%s schema>' % cls.__name__, 'exec')
+	exec code in _namespace
+
+	decoder = _namespace.pop('NewFromJsonDict')
+	decoder.__doc__ = _DECODE_DOC % cls.__name__
+	encoder = _namespace.pop('AsDict')
+	encoder.__doc__ = _ENCODE_DOC % (cls.__name__, cls.__name__)
+	cls.NewFromJsonDict = staticmethod(decoder)
+	cls.AsDict = encoder
+	cls.__getstate__ = _GetState
+	cls.__setstate__ = _SetState
+
+	lazy = [field.attr for field in own_fields if field.lazy]
+	if lazy:
+		_MakeLazy(cls, *lazy)
+	return cls
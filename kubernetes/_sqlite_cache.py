@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import getpass
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from kubernetes._compression import _GetCodec, _Compress, _Decompress, _CompressionError
+
+class _SqliteCacheError(Exception):
+  '''Base exception class for SqliteCache related errors'''
+
+class _SqliteCache(object):
+  '''A cache with the same API as _FileCache kept in a single SQLite file.
+
+  All entries live in one indexed table, so a Set costs one transaction
+  instead of a temporary file, a rename and several stat calls, and the
+  cache uses a single inode.  The database runs in WAL mode so several
+  worker processes can share it: readers never block, and writers wait
+  up to `timeout` seconds for each other.
+
+  codec and compress_threshold work as for _FileCache.
+  '''
+
+  def __init__(self, path=None, timeout=30, codec=None,
+               compress_threshold=4096):
+    self._path = self._InitializePath(path)
+    self._timeout = timeout
+    self._codec = _GetCodec(codec)
+    self._compress_threshold = compress_threshold
+    self._local = threading.local()
+    self._Execute('CREATE TABLE IF NOT EXISTS cache ('
+                  'key TEXT PRIMARY KEY, '
+                  'data BLOB NOT NULL, '
+                  'cached_time REAL NOT NULL)')
+
+  def Get(self, key):
+    row = self._Execute('SELECT data FROM cache WHERE key = ?',
+                        (key,)).fetchone()
+    if row is None:
+      return None
+    try:
+      return _Decompress(str(row[0]), self._codec)
+    except _CompressionError:
+      # Corrupt, or written by a worker with a codec missing here: a miss
+      self.Remove(key)
+      return None
+
+  def Set(self, key, data):
+    self._Execute('INSERT OR REPLACE INTO cache (key, data, cached_time) '
+                  'VALUES (?, ?, ?)',
+                  (key,
+                   sqlite3.Binary(_Compress(self._codec,
+                                            self._compress_threshold, data)),
+                   time.time()))
+
+  def Remove(self, key):
+    self._Execute('DELETE FROM cache WHERE key = ?', (key,))
+
+  def GetCachedTime(self, key):
+    row = self._Execute('SELECT cached_time FROM cache WHERE key = ?',
+                        (key,)).fetchone()
+    if row is None:
+      return None
+    return row[0]
+
+  def _Execute(self, statement, parameters=()):
+    connection = self._GetConnection()
+    with connection:
+      return connection.execute(statement, parameters)
+
+  def _GetConnection(self):
+    '''Return this thread's connection, opening a new one after a fork.'''
+    connection = getattr(self._local, 'connection', None)
+    if connection is None or self._local.pid != os.getpid():
+      connection = sqlite3.connect(self._path, timeout=self._timeout)
+      connection.text_factory = str
+      connection.execute('PRAGMA journal_mode=WAL')
+      connection.execute('PRAGMA synchronous=NORMAL')
+      self._local.connection = connection
+      self._local.pid = os.getpid()
+    return connection
+
+  def _GetUsername(self):
+    try:
+      return getpass.getuser()
+    except (ImportError, KeyError, IOError, OSError):
+      return 'nobody'
+
+  def _InitializePath(self, path):
+    if not path:
+      path = os.path.join(tempfile.gettempdir(),
+                          'python-kubernetes.cache_%s.sqlite' % self._GetUsername())
+    path = os.path.abspath(path)
+    if os.path.isdir(path):
+      raise _SqliteCacheError('%s exists but is a directory' % path)
+    return path
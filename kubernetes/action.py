@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _ValueList, _Model, _CompileModel
 
 class EnvVar(object):
 	"""A Class representing the EnvVar structure used by the kubernetes API
@@ -27,6 +28,11 @@ class EnvVar(object):
 	EnvVar.Value
 
 	"""
+	__slots__ = ('Name', 'Value')
+	_FIELDS = (
+		_Value('Name', 'name'),
+		_Value('Value', 'value', ""))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete EnvVar.
 		
@@ -73,31 +79,8 @@ class EnvVar(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.EnvVar instance.
-
-		The return values uses the same key names as the JSON representation.
+_CompileModel(EnvVar)
 
-		Returns:
-		  A dict representing this kubernetes.EnvVar instance
-		'''
-		data = {}
-		if self.Name:
-			data['name'] = self.Name
-		if self.Value:
-			data['value'] = self.Value
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.EnvVar instance
-		'''
-		return EnvVar(Name=data.get('name', None),
-					Value=data.get('value', ""))
 
 class HTTPGetAction(object):
 	"""A Class representing the HTTPGetAction structure used by the kubernetes API
@@ -111,6 +94,12 @@ class HTTPGetAction(object):
 	HTTPGetAction.Host
 
 	"""
+	__slots__ = ('Path', 'Port', 'Host')
+	_FIELDS = (
+		_Value('Path', 'path'),
+		_Value('Port', 'port'),
+		_Value('Host', 'host'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete HTTPGetAction.
 		
@@ -161,34 +150,8 @@ class HTTPGetAction(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.HTTPGetAction instance.
+_CompileModel(HTTPGetAction)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.HTTPGetAction instance
-		'''
-		data = {}
-		if self.Path:
-			data['path'] = self.Path
-		if self.Port:
-			data['port'] = self.Port
-		if self.Host:
-			data['host'] = self.Host
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.HTTPGetAction instance
-		'''
-		return HTTPGetAction(Path=data.get('path', None),
-					Port=data.get('port', None),
-					Host=data.get('host', None))
 
 class TCPSocketAction(object):
 	"""A Class representing the TCPSocketAction structure used by the kubernetes API
@@ -200,6 +163,9 @@ class TCPSocketAction(object):
 	TCPSocketAction.Port
 
 	"""
+	__slots__ = ('Port',)
+	_FIELDS = (_Value('Port', 'port'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete TCPSocketAction.
 		
@@ -242,28 +208,7 @@ class TCPSocketAction(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.TCPSocketAction instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.TCPSocketAction instance
-		'''
-		data = {}
-		if self.Port:
-			data['port'] = self.Port
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.TCPSocketAction instance
-		'''
-		return TCPSocketAction(Port=data.get('port', None))
+_CompileModel(TCPSocketAction)
 
 
 class ExecAction(object):
@@ -276,6 +221,9 @@ class ExecAction(object):
 	ExecAction.Command
 
 	"""
+	__slots__ = ('Command',)
+	_FIELDS = (_ValueList('Command', 'command'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ExecAction.
 		
@@ -321,33 +269,8 @@ class ExecAction(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ExecAction instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ExecAction instance
-		'''
-		data = {}
-		if self.Command:
-			data['command'] = self.Command
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ExecAction instance
-		'''
-
-		command = None
-		if 'command' in data:
-			command = [c for c in data['command']]
+_CompileModel(ExecAction)
 
-		return ExecAction(Command=command)
 
 class LivenessProbe(object):
 	"""A Class representing the LivenessProbe structure used by the kubernetes API
@@ -363,6 +286,13 @@ class LivenessProbe(object):
 	LivenessProbe.InitialDelaySeconds
 
 	"""
+	__slots__ = ('HTTPGet', 'TCPSocket', 'Exec', 'InitialDelaySeconds')
+	_FIELDS = (
+		_Model('HTTPGet', 'httpGet', 'HTTPGetAction'),
+		_Model('TCPSocket', 'tcpSocket', 'TCPSocketAction'),
+		_Model('Exec', 'exec', 'ExecAction'),
+		_Value('InitialDelaySeconds', 'initialDelaySeconds'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete LivenessProbe.
 		
@@ -417,51 +347,5 @@ class LivenessProbe(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.LivenessProbe instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.LivenessProbe instance
-		'''
-		data = {}
-		if self.HTTPGet:
-			data['httpGet'] = self.HTTPGet.AsDict()
-		if self.TCPSocket:
-			data['tcpSocket'] = self.TCPSocket.AsDict()
-		if self.Exec:
-			data['exec'] = self.Exec.AsDict()
-		if self.InitialDelaySeconds:
-			data['initialDelaySeconds'] = self.InitialDelaySeconds
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.LivenessProbe instance
-		'''
-
-		httpGet = None
-		tcpSocket = None
-		Exec = None
-
-		if 'httpGet' in data:
-			from kubernetes import HttpGetAction
-			httpGet = HttpGetAction.NewFromJsonDict(data['httpGet'])
-
-		if 'tcpSocket' in data:
-			from kubernetes import TCPSocketAction
-			tcpSocket = TCPSocketAction.NewFromJsonDict(data['tcpSocket'])
-
-		if 'exec' in data:
-			from kubernetes import ExecAction
-			Exec = ExecAction.NewFromJsonDict(data['exec'])
+_CompileModel(LivenessProbe)
 
-		return LivenessProbe(HTTPGet=httpGet,
-					TCPSocket=tcpSocket,
-					Exec=Exec,
-					InitialDelaySeconds=data.get('initialDelaySeconds', None))
@@ -17,19 +17,42 @@
 '''A library that provides a Python interface to the Kubernetes API'''
 
 import sys
+import time
+import threading
 import urllib
 import urllib2
 import urlparse
 import requests
+from multiprocessing.pool import ThreadPool
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE, DEFAULT_POOLBLOCK
 
 import urllib3
 urllib3.disable_warnings()
 
-from kubernetes import (__version__, _FileCache, simplejson, KubernetesError, PodList)
+from kubernetes import (__version__, _FileCache, _MemoryCache, _GetJsonBackend, simplejson, KubernetesError,
+	Pod, PodList, Service, ServiceList, ReplicationController, ReplicationControllerList, Minion, MinionList,
+	EventList, LabelSelector, ClusterSnapshot, RetryPolicy)
+from kubernetes._json_stream import _IterJsonArray
+from kubernetes._projection import _CompileProjection
+from kubernetes.snapshot import RESOURCES as SNAPSHOT_RESOURCES, CLUSTER_RESOURCES
 
 # A singleton representing a lazily instantiated FileCache.
 DEFAULT_CACHE = object()
 
+# The limits of the _FileCache behind DEFAULT_CACHE: 128 MB on disk, and
+# entries expire a day after they were written.
+DEFAULT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_CACHE_MAX_AGE = 24 * 60 * 60
+
+# A singleton representing a RetryPolicy with its default settings.
+DEFAULT_RETRY_POLICY = object()
+
+# The number of bytes read from the socket at a time when streaming lists.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# The default number of items requested per page by the paged list methods.
+DEFAULT_PAGE_SIZE = 500
+
 class Api(object):
 	'''A python interface into the Kubernetes API'''
 	def __init__(self,
@@ -38,9 +61,19 @@ class Api(object):
 				input_encoding=None,
 				request_headers=None,
 				cache=DEFAULT_CACHE,
+				object_cache=None,
 				base_url=None,
 				debugHTTP=None,
-				timeout=None):
+				timeout=None,
+				lazy_decoding=False,
+				json_backend=None,
+				pool_connections=DEFAULT_POOLSIZE,
+				pool_maxsize=DEFAULT_POOLSIZE,
+				pool_block=DEFAULT_POOLBLOCK,
+				pool_idle_timeout=None,
+				keep_alive=True,
+				retry_policy=DEFAULT_RETRY_POLICY,
+				rate_limiter=None):
 		'''Instantiate a new kubernetes.Api object
 
 		Args:
@@ -53,8 +86,16 @@ class Api(object):
 		  request_headers
 		  	A dictionary of additional HTTP request headers. [Optional]
 		  cache:
-		  	The cache instance to use. Defaults to DEFAULT_CACHE.
+		  	The cache instance to use. Defaults to DEFAULT_CACHE, an
+			in-memory LRU in front of a _FileCache bounded to
+			DEFAULT_CACHE_MAX_BYTES and DEFAULT_CACHE_MAX_AGE.
 		  	Use None to disable caching. [Optional]
+		  object_cache:
+		  	The cache of decoded model objects to use, or DEFAULT_CACHE
+			for an in-memory LRU of the most recent lists.  Cached
+			objects are shared between callers, which must then not
+			modify them.  Defaults to None, decoding every response
+			into new objects. [Optional]
 		  base_url:
 		    The base URL to use to contact the kubernetes API.
 		    Defaults to https://10.245.1.2/api/v1beta2
@@ -64,16 +105,60 @@ class Api(object):
 		  timeout:
 			Set timeout (in seconds) of the http/https requests. If None the
 			requests lib default will be used.  Defaults to None. [Optional]
+		  lazy_decoding:
+		  	Set to True to decode the states, manifests and container
+			statuses nested in pods and replication controllers only when
+			they are first accessed.  Defaults to False. [Optional]
+		  json_backend:
+		  	The JSON library used to decode responses: 'orjson', 'ujson',
+			'rapidjson', 'simplejson' or 'json'.  Defaults to the fastest
+			one installed.  The streaming Iter* methods need an
+			incremental decoder, which only simplejson and json have; with
+			the other backends they decode with json. [Optional]
+		  pool_connections:
+		  	The number of per-host connection pools to cache. [Optional]
+		  pool_maxsize:
+		  	The maximum number of connections kept open per host. [Optional]
+		  pool_block:
+		  	Set to True to block when every pooled connection to a host is
+			in use instead of opening a throw-away one. [Optional]
+		  pool_idle_timeout:
+		  	Drop all pooled connections once the pool has been idle for this
+			many seconds. If None, connections are kept until Close().
+			Defaults to None. [Optional]
+		  keep_alive:
+		  	Set to False to send "Connection: close" and stop reusing
+			connections. Defaults to True. [Optional]
+		  retry_policy:
+		  	The kubernetes.RetryPolicy deciding which failed requests are
+			sent again.  Defaults to DEFAULT_RETRY_POLICY, retrying GET, PUT
+			and DELETE up to 3 times on connection errors, timeouts and 429
+			or 5xx responses.  Use None to never retry. [Optional]
+		  rate_limiter:
+		  	A kubernetes.RateLimiter capping the requests per second and
+			the requests in flight, shared by every thread using this
+			Api.  If None requests are sent as soon as they are made.
+			Defaults to None. [Optional]
 		'''
 		self.SetCache(cache)
+		self.SetRetryPolicy(retry_policy)
+		self.SetRateLimiter(rate_limiter)
+		self.SetObjectCache(object_cache)
 		self._urllib	=	urllib2
 		self._input_encoding = input_encoding
 		self._debugHTTP	=	debugHTTP
 		self._timeout	=	timeout
+		self._lazy_decoding = lazy_decoding
+		self.SetJsonBackend(json_backend)
 
 		self._InitializeRequestHeaders(request_headers)
 		self._InitializeUserAgent()
 		self._InitializeDefaultParameters()
+		self.SetConnectionPool(pool_connections=pool_connections,
+			pool_maxsize=pool_maxsize,
+			pool_block=pool_block,
+			pool_idle_timeout=pool_idle_timeout,
+			keep_alive=keep_alive)
 
 		if base_url is None:
 			self.base_url = 'https://10.245.1.2/api/v1beta2'
@@ -118,37 +203,473 @@ class Api(object):
 
 		self._config = None
 
+	def SetConnectionPool(self,
+		pool_connections=DEFAULT_POOLSIZE,
+		pool_maxsize=DEFAULT_POOLSIZE,
+		pool_block=DEFAULT_POOLBLOCK,
+		pool_idle_timeout=None,
+		keep_alive=True):
+		'''Replace the pooled HTTP session shared by every request verb.
+
+		Any connections held by the previous session are closed.
+
+		Args:
+		  pool_connections:
+		  	The number of per-host connection pools to cache.
+		  pool_maxsize:
+		  	The maximum number of connections kept open per host.
+		  pool_block:
+		  	Set to True to block when the per-host pool is exhausted.
+		  pool_idle_timeout:
+		  	Seconds of inactivity after which pooled connections are dropped.
+		  	None to keep them until Close().
+		  keep_alive:
+		  	Set to False to close the connection after every request.
+		'''
+		session = requests.Session()
+		adapter = HTTPAdapter(pool_connections=pool_connections,
+			pool_maxsize=pool_maxsize,
+			pool_block=pool_block)
+		session.mount('https://', adapter)
+		session.mount('http://', adapter)
+		if not keep_alive:
+			session.headers['Connection'] = 'close'
+
+		old_session = getattr(self, '_session', None)
+		self._session = session
+		self._pool_idle_timeout = pool_idle_timeout
+		self._pool_lock = threading.Lock()
+		self._last_request_time = time.time()
+		if old_session is not None:
+			old_session.close()
+
+	def GetSession(self):
+		'''Return the pooled requests.Session used by this instance.
+
+		The session (and its mounted adapters) may be tuned directly, e.g.
+		to mount a differently sized HTTPAdapter for a given host.
+		'''
+		return self._session
+
+	def Close(self):
+		'''Close every pooled connection held by this instance.'''
+		self._session.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.Close()
+
 	def ClearCredentials(self):
 		'''Clear any credentials for this instance'''
 		self._user_id = None
 		self._user_password = None
 
-	def GetPods(self):
-		'''List all pods on this cluster'''
+	def GetPods(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None):
+		'''List all pods on this cluster
+
+		Args:
+		  raw:
+		  	If True, return the parsed JSON instead of
+			a kubernetes.PodList. [Optional]
+		  fields:
+		  	A list of dotted field paths, such as ['id', 'labels',
+			'currentState.host'], to keep in each item; all other fields
+			are dropped.  Implies raw. [Optional]
+		  namespace:
+		  	Only list the pods of this namespace. [Optional]
+		  label_selector:
+		  	Only list the pods matching this selector, given as
+			a kubernetes.LabelSelector, a selector string such as
+			'name=frontend,tier!=cache' or a dict of labels. [Optional]
+		  field_selector:
+		  	Only list the pods whose fields match, given as a string such
+			as 'currentState.host=minion-1' or a dict of field paths to
+			values. [Optional]
+
+		The selectors are evaluated by the apiserver, so only matching
+		pods are sent.
+		'''
 		
 		# Make and send requests
-		url = '%s/pods' % self.base_url
-		json = self._RequestUrl(url, 'GET')
-		data = self._ParseAndCheckKubernetes(json.content)
-		return PodList.NewFromJsonDict(data)
+		url = self._BuildListUrl('pods', namespace, label_selector, field_selector)
+		return self._GetList(url, PodList, raw=raw, fields=fields, lazy=self._lazy_decoding)
 
-	def GetReplicationControllers(self):
-		'''List all replicationControllers on this cluster'''
+	def GetReplicationControllers(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None):
+		'''List all replicationControllers on this cluster
+
+		Args:
+		  raw:
+		  	If True, return the parsed JSON instead of
+			a kubernetes.ReplicationControllerList. [Optional]
+		  fields:
+		  	A list of dotted field paths, such as ['id',
+			'desiredState.replicas'], to keep in each item; all other fields
+			are dropped.  Implies raw. [Optional]
+		  namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+		'''
 		
 		# Make and send requests
-		url = '%s/replicationControllers' % self.base_url
-		json = self._RequestUrl(url, 'GET')
-		data = self._ParseAndCheckKubernetes(json.content)
-		return PodList.NewFromJsonDict(data)
+		url = self._BuildListUrl('replicationControllers', namespace, label_selector, field_selector)
+		return self._GetList(url, ReplicationControllerList, raw=raw, fields=fields, lazy=self._lazy_decoding)
 
-	def GetServices(self):
-		'''List all services on this cluster'''
+	def GetServices(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None):
+		'''List all services on this cluster
+
+		Args:
+		  raw:
+		  	If True, return the parsed JSON instead of
+			a kubernetes.ServiceList. [Optional]
+		  fields:
+		  	A list of dotted field paths, such as ['id', 'selector',
+			'port'], to keep in each item; all other fields
+			are dropped.  Implies raw. [Optional]
+		  namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+		'''
 		
 		# Make and send requests
-		url = '%s/services' % self.base_url
-		json = self._RequestUrl(url, 'GET')
-		data = self._ParseAndCheckKubernetes(json.content)
-		return PodList.NewFromJsonDict(data)
+		url = self._BuildListUrl('services', namespace, label_selector, field_selector)
+		return self._GetList(url, ServiceList, raw=raw, fields=fields)
+
+	def GetMinions(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None):
+		'''List all minions on this cluster
+
+		Args:
+		  raw:
+		  	If True, return the parsed JSON instead of
+			a kubernetes.MinionList. [Optional]
+		  fields:
+		  	A list of dotted field paths, such as ['id', 'hostIP'], to keep
+			in each item; all other fields are dropped.  Implies raw. [Optional]
+		  namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+		'''
+		
+		# Make and send requests
+		url = self._BuildListUrl('minions', namespace, label_selector, field_selector)
+		return self._GetList(url, MinionList, raw=raw, fields=fields)
+
+	def GetEvents(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None):
+		'''List all events on this cluster
+
+		Args:
+		  raw:
+		  	If True, return the parsed JSON instead of
+			a kubernetes.EventList. [Optional]
+		  fields:
+		  	A list of dotted field paths, such as ['id', 'reason',
+			'involvedObject.name'], to keep in each item; all other fields
+			are dropped.  Implies raw. [Optional]
+		  namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+		'''
+		
+		# Make and send requests
+		url = self._BuildListUrl('events', namespace, label_selector, field_selector)
+		return self._GetList(url, EventList, raw=raw, fields=fields)
+
+	def GetSnapshot(self, namespaces=None, resources=None, max_workers=8):
+		'''List pods, services, replicationControllers, minions and events
+		concurrently and return them together
+
+		Every list request runs on its own worker thread, sharing the
+		connection pool of this Api, so the snapshot takes about as long as
+		the slowest request rather than the sum of all of them.
+
+		Args:
+		  namespaces:
+		  	A list of namespaces to list, one request per namespace and
+			resource.  Minions belong to no namespace and are listed once.
+			Defaults to one request per resource across all namespaces.
+			[Optional]
+		  resources:
+		  	The resources to list, out of 'pods', 'services',
+			'replicationControllers', 'minions' and 'events'.  Defaults to
+			all of them. [Optional]
+		  max_workers:
+		  	The most requests in flight at once.  Defaults to 8; keep it
+			at most pool_maxsize to avoid waiting for connections. [Optional]
+
+		Returns:
+		  A kubernetes.ClusterSnapshot.  If any request fails, its
+		  KubernetesError is raised once all requests have finished.
+		'''
+		methods = dict([(name, method) for (name, method, attr) in SNAPSHOT_RESOURCES])
+		if resources is None:
+			resources = [name for (name, method, attr) in SNAPSHOT_RESOURCES]
+		calls = []
+		for resource in resources:
+			if resource not in methods:
+				raise KubernetesError({'message': 'unknown snapshot resource %s' % resource})
+			if resource in CLUSTER_RESOURCES or not namespaces:
+				calls.append((resource, None))
+			else:
+				calls.extend([(resource, namespace) for namespace in namespaces])
+
+		start = time.time()
+		snapshot = ClusterSnapshot()
+		if not calls:
+			snapshot.Elapsed = 0.0
+			return snapshot
+		pool = ThreadPool(max(1, min(max_workers, len(calls))))
+		try:
+			results = [pool.apply_async(self._TimedList, (getattr(self, methods[resource]), namespace))
+				for (resource, namespace) in calls]
+			pool.close()
+			outcomes = [result.get() for result in results]
+		finally:
+			pool.close()
+			pool.join()
+		for ((resource, namespace), (items, elapsed)) in zip(calls, outcomes):
+			snapshot._Add(resource, namespace, items, elapsed)
+		snapshot.Elapsed = time.time() - start
+		return snapshot
+
+	def IterPods(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None,
+			page_size=None):
+		'''Iterate over all pods on this cluster
+
+		Pods are decoded and yielded one at a time while the response is
+		still being received, so memory use does not grow with the size of
+		the cluster.  The cache is bypassed.
+
+		Args:
+		  raw:
+		  	If True, yield the parsed JSON of each pod. [Optional]
+		  fields:
+		  	A list of dotted field paths to keep in each pod, as for
+			GetPods.  Fields are dropped as each pod is received.
+			Implies raw. [Optional]
+		  namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+		  page_size:
+		  	If given, fetch the pods page_size at a time with
+			IterPodPages instead of streaming a single response. [Optional]
+
+		Returns:
+		  A generator of kubernetes.Pod instances
+		'''
+		if page_size is not None:
+			pages = self._IterPages('pods', PodList, page_size, raw, fields,
+				namespace, label_selector, field_selector, lazy=self._lazy_decoding)
+			return self._IterPageItems(pages)
+		url = self._BuildListUrl('pods', namespace, label_selector, field_selector)
+		return self._IterJson(url, Pod, raw=raw, fields=fields, lazy=self._lazy_decoding)
+
+	def IterReplicationControllers(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None,
+			page_size=None):
+		'''Iterate over all replicationControllers on this cluster
+
+		Args:
+		  raw, fields, namespace, label_selector, field_selector, page_size:
+		  	As for IterPods and GetReplicationControllers. [Optional]
+
+		Returns:
+		  A generator of kubernetes.ReplicationController instances
+		'''
+		if page_size is not None:
+			pages = self._IterPages('replicationControllers', ReplicationControllerList, page_size, raw, fields,
+				namespace, label_selector, field_selector, lazy=self._lazy_decoding)
+			return self._IterPageItems(pages)
+		url = self._BuildListUrl('replicationControllers', namespace, label_selector, field_selector)
+		return self._IterJson(url, ReplicationController, raw=raw, fields=fields, lazy=self._lazy_decoding)
+
+	def IterServices(self, raw=False, fields=None, namespace=None, label_selector=None, field_selector=None,
+			page_size=None):
+		'''Iterate over all services on this cluster
+
+		Args:
+		  raw, fields, namespace, label_selector, field_selector, page_size:
+		  	As for IterPods and GetServices. [Optional]
+
+		Returns:
+		  A generator of kubernetes.Service instances
+		'''
+		if page_size is not None:
+			pages = self._IterPages('services', ServiceList, page_size, raw, fields,
+				namespace, label_selector, field_selector)
+			return self._IterPageItems(pages)
+		url = self._BuildListUrl('services', namespace, label_selector, field_selector)
+		return self._IterJson(url, Service, raw=raw, fields=fields)
+
+	def IterPodPages(self, page_size=DEFAULT_PAGE_SIZE, raw=False, fields=None,
+			namespace=None, label_selector=None, field_selector=None):
+		'''List the pods on this cluster one page at a time
+
+		Each request asks for at most page_size pods and passes on the
+		continue token of the previous page, so neither the apiserver nor
+		this process has to hold the whole list at once.  Servers that do
+		not support paging send everything in the first response, which is
+		then split into pages of page_size here.  Pages bypass the cache.
+
+		Args:
+		  page_size:
+		  	The number of pods per page.  Defaults to DEFAULT_PAGE_SIZE.
+			Larger pages need fewer requests, smaller ones less memory.
+			[Optional]
+		  raw, fields, namespace, label_selector, field_selector:
+		  	As for GetPods. [Optional]
+
+		Returns:
+		  A generator of kubernetes.PodList instances, or of parsed JSON
+		  if raw or fields are given
+		'''
+		return self._IterPages('pods', PodList, page_size, raw, fields,
+			namespace, label_selector, field_selector, lazy=self._lazy_decoding)
+
+	def IterReplicationControllerPages(self, page_size=DEFAULT_PAGE_SIZE, raw=False, fields=None,
+			namespace=None, label_selector=None, field_selector=None):
+		'''List the replicationControllers on this cluster one page at a time
+
+		Args:
+		  page_size, raw, fields, namespace, label_selector, field_selector:
+		  	As for IterPodPages. [Optional]
+
+		Returns:
+		  A generator of kubernetes.ReplicationControllerList instances
+		'''
+		return self._IterPages('replicationControllers', ReplicationControllerList, page_size, raw, fields,
+			namespace, label_selector, field_selector, lazy=self._lazy_decoding)
+
+	def IterServicePages(self, page_size=DEFAULT_PAGE_SIZE, raw=False, fields=None,
+			namespace=None, label_selector=None, field_selector=None):
+		'''List the services on this cluster one page at a time
+
+		Args:
+		  page_size, raw, fields, namespace, label_selector, field_selector:
+		  	As for IterPodPages. [Optional]
+
+		Returns:
+		  A generator of kubernetes.ServiceList instances
+		'''
+		return self._IterPages('services', ServiceList, page_size, raw, fields,
+			namespace, label_selector, field_selector)
+
+	def IterMinionPages(self, page_size=DEFAULT_PAGE_SIZE, raw=False, fields=None,
+			namespace=None, label_selector=None, field_selector=None):
+		'''List the minions on this cluster one page at a time
+
+		Args:
+		  page_size, raw, fields, namespace, label_selector, field_selector:
+		  	As for IterPodPages. [Optional]
+
+		Returns:
+		  A generator of kubernetes.MinionList instances
+		'''
+		return self._IterPages('minions', MinionList, page_size, raw, fields,
+			namespace, label_selector, field_selector)
+
+	def WatchPods(self, resource_version=None, namespace=None, label_selector=None, field_selector=None):
+		'''Watch the pods on this cluster for changes
+
+		The request stays open and every change is yielded as soon as the
+		server sends it.  Use a kubernetes.Informer to keep a local copy of
+		all pods up to date instead of handling the events yourself.
+
+		Args:
+		  resource_version:
+		  	Only report changes after this version, usually the
+			ResourceVersion of a previous list or event. [Optional]
+		  namespace, label_selector, field_selector:
+		  	Only report changes to matching pods, as for GetPods. [Optional]
+
+		Returns:
+		  A generator of (event type, kubernetes.Pod) tuples, the event type
+		  being one of 'ADDED', 'MODIFIED' or 'DELETED'
+		'''
+		url = self._BuildListUrl('watch/pods', namespace, label_selector, field_selector,
+			resourceVersion=resource_version)
+		return self._Watch(url, Pod, lazy=self._lazy_decoding)
+
+	def WatchReplicationControllers(self, resource_version=None, namespace=None, label_selector=None, field_selector=None):
+		'''Watch the replicationControllers on this cluster for changes
+
+		Args:
+		  resource_version, namespace, label_selector, field_selector:
+		  	As for WatchPods. [Optional]
+
+		Returns:
+		  A generator of (event type, kubernetes.ReplicationController)
+		  tuples, as for WatchPods
+		'''
+		url = self._BuildListUrl('watch/replicationControllers', namespace, label_selector, field_selector,
+			resourceVersion=resource_version)
+		return self._Watch(url, ReplicationController, lazy=self._lazy_decoding)
+
+	def WatchServices(self, resource_version=None, namespace=None, label_selector=None, field_selector=None):
+		'''Watch the services on this cluster for changes
+
+		Args:
+		  resource_version, namespace, label_selector, field_selector:
+		  	As for WatchPods. [Optional]
+
+		Returns:
+		  A generator of (event type, kubernetes.Service) tuples, as for
+		  WatchPods
+		'''
+		url = self._BuildListUrl('watch/services', namespace, label_selector, field_selector,
+			resourceVersion=resource_version)
+		return self._Watch(url, Service)
+
+	def WatchMinions(self, resource_version=None, namespace=None, label_selector=None, field_selector=None):
+		'''Watch the minions on this cluster for changes
+
+		Args:
+		  resource_version, namespace, label_selector, field_selector:
+		  	As for WatchPods. [Optional]
+
+		Returns:
+		  A generator of (event type, kubernetes.Minion) tuples, as for
+		  WatchPods
+		'''
+		url = self._BuildListUrl('watch/minions', namespace, label_selector, field_selector,
+			resourceVersion=resource_version)
+		return self._Watch(url, Minion)
+
+	def SetJsonBackend(self, json_backend):
+		'''Override the JSON library used to decode responses.
+
+		Args:
+		  json_backend:
+		  	A backend name as listed by kubernetes.GetJsonBackends(), or
+			None for the fastest one available.
+		'''
+		try:
+			self._json = _GetJsonBackend(json_backend)
+		except ValueError as e:
+			raise KubernetesError({'message': str(e)})
+
+	def SetRetryPolicy(self, retry_policy):
+		'''Override the retry policy.  Set to None to never retry.
+
+		Args:
+		  retry_policy:
+		  	A kubernetes.RetryPolicy, or DEFAULT_RETRY_POLICY.
+		'''
+		if retry_policy == DEFAULT_RETRY_POLICY:
+			self._retry_policy = RetryPolicy()
+		else:
+			self._retry_policy = retry_policy
+
+	def GetRetryPolicy(self):
+		'''Return the kubernetes.RetryPolicy in use, or None.'''
+		return self._retry_policy
+
+	def SetRateLimiter(self, rate_limiter):
+		'''Override the rate limiter.  Set to None to send requests unthrottled.
+
+		Args:
+		  rate_limiter:
+		  	A kubernetes.RateLimiter, or None.
+		'''
+		self._rate_limiter = rate_limiter
+
+	def GetRateLimiter(self):
+		'''Return the kubernetes.RateLimiter in use, or None.'''
+		return self._rate_limiter
 
 	def SetCache(self, cache):
 		'''Override the default cache.  Set to None to prevent caching.
@@ -158,10 +679,32 @@ class Api(object):
 			An instance that supports the same API as the kubernetes._FileCache
 		'''
 		if cache == DEFAULT_CACHE:
-			self._cache = _FileCache()
+			self._cache = _MemoryCache(_FileCache(
+				max_bytes=DEFAULT_CACHE_MAX_BYTES,
+				max_age=DEFAULT_CACHE_MAX_AGE))
 		else:
 			self._cache = cache
 
+	def SetObjectCache(self, object_cache):
+		'''Set the cache of decoded model objects.  Set to None, the
+		default, to decode every response.
+
+		Decoded lists are keyed by URL and remembered with the resourceVersion
+		(or ETag) they were decoded from; while that version is unchanged the
+		very same instance is returned again.  Instances handed out this way
+		are shared between callers and must be treated as read-only, which
+		is why the cache is off unless asked for.
+
+		Args:
+		  object_cache:
+		  	An instance that supports the same API as kubernetes._MemoryCache,
+			or DEFAULT_CACHE for a _MemoryCache of 32 lists.
+		'''
+		if object_cache == DEFAULT_CACHE:
+			self._object_cache = _MemoryCache(max_entries=32, sizeof=None)
+		else:
+			self._object_cache = object_cache
+
 	def _InitializeRequestHeaders(self, request_headers):
 		if request_headers:
 			self._request_headers = request_headers
@@ -186,6 +729,11 @@ class Api(object):
 		self._request_headers['User-Agent'] = user_agent
 
 	def _Encode(self, s):
+		if isinstance(s, unicode):
+			return s.encode('utf-8')
+		if not isinstance(s, basestring):
+			# Numbers such as limit and resourceVersion
+			s = str(s)
 		if self._input_encoding:
 			return unicode(s, self._input_encoding).encode('utf-8')
 		else:
@@ -226,15 +774,29 @@ class Api(object):
 		if extra_params and len(extra_params) > 0:
 			extra_query = self._EncodeParameters(extra_params)
 			# Add it to the existing query
-			if query:
+			if query and extra_query:
 				query += '&' + extra_query
-			else:
+			elif extra_query:
 				query = extra_query
 
 		# Return the rebuilt URL
-		return urlparse.urlparse((scheme, netloc, path, params, query, fragment))
+		return urlparse.urlunparse((scheme, netloc, path, params, query, fragment))
 
-	def _RequestUrl(self, url, verb, data=None):
+	def _BuildListUrl(self, path, namespace=None, label_selector=None, field_selector=None, **extra_params):
+		'''Build the url listing the resources under path, filtered on the
+		apiserver by namespace, labels and fields.
+		'''
+		parameters = dict(extra_params)
+		parameters['namespace'] = namespace
+		if label_selector is not None:
+			parameters['labels'] = str(LabelSelector.NewFrom(label_selector)) or None
+		if field_selector is not None:
+			if isinstance(field_selector, dict):
+				field_selector = ','.join(['%s=%s' % item for item in sorted(field_selector.iteritems())])
+			parameters['fields'] = field_selector or None
+		return self._BuildUrl('%s/%s' % (self.base_url, path), extra_params=parameters)
+
+	def _RequestUrl(self, url, verb, data=None, headers=None, stream=False):
 		'''Request a url.
 		
 			Args:
@@ -244,53 +806,312 @@ class Api(object):
 			 	POST, GET, PUT, DELETE.
 			 data:
 			 	a dict of (str, unicode) key/value pairs.
+			 headers:
+			 	a dict of extra HTTP headers for this request only.
+			 stream:
+			 	If True, return as soon as the headers are received and
+				leave the body to be read from the response.
+
+			Requests the retry policy deems transient failures are sent
+			again after its backoff delay.  Every attempt first waits for
+			the rate limiter, and holds its in-flight slot until the
+			headers are received, so streamed bodies and backoff delays
+			do not count against max_in_flight.
 
 			Returns:
 			 A JSON object.
 		'''
-		if verb == 'POST':
-			try:
-				return requests.post(
-					url,
-					data=data,
-					auth=self.__auth,
-					timeout=self._timeout,
-					verify=False
-					)
-			except requests.RequestException as e:
-				raise KubernetesError(str(e))
-		if verb == 'GET':
-			try:
-				return requests.get(
-					url,
-					auth=self.__auth,
-					timeout=self._timeout,
-					verify=False
-					)
-			except requests.RequestException as e:
-				raise KubernetesError(str(e))
-		if verb == 'PUT':
+		if verb not in ('POST', 'GET', 'PUT', 'DELETE'):
+			return 0
+
+		if headers:
+			request_headers = dict(self._request_headers)
+			request_headers.update(headers)
+		else:
+			request_headers = self._request_headers
+
+		policy = self._retry_policy
+		limiter = self._rate_limiter
+		if policy is not None:
+			policy.RecordRequest()
+		attempt = 0
+		while True:
+			response = None
+			error = None
+			if limiter is not None:
+				limiter.Acquire()
 			try:
-				return requests.put(
+				self._ExpireIdleConnections()
+				response = self._session.request(
+					verb,
 					url,
 					data=data,
+					headers=request_headers,
 					auth=self.__auth,
 					timeout=self._timeout,
-					verify=False
+					verify=False,
+					stream=stream
 					)
 			except requests.RequestException as e:
-				raise KubernetesError(str(e))
-		if verb == 'DELETE':
-			try:
-				return requests.get(
-					url,
-					auth=self.__auth,
-					timeout=self._timeout,
-					verify=False
-					)
-			except requests.RequestException as e:
-				raise KubernetesError(str(e))
-		return 0 
+				error = e
+			finally:
+				if limiter is not None:
+					limiter.Release()
+			if policy is None or not policy.ShouldRetry(verb, attempt, response, error):
+				if error is not None:
+					raise KubernetesError(str(error))
+				return response
+			delay = policy.GetDelay(attempt, response)
+			if response is not None:
+				response.close()
+			time.sleep(delay)
+			attempt += 1
+
+	def _ExpireIdleConnections(self):
+		'''Drop pooled connections that have sat idle past pool_idle_timeout.'''
+		with self._pool_lock:
+			now = time.time()
+			if self._pool_idle_timeout is not None and \
+				now - self._last_request_time > self._pool_idle_timeout:
+				for adapter in self._session.adapters.values():
+					adapter.poolmanager.clear()
+			self._last_request_time = now
+
+	def _GetJson(self, url, model=None, lazy=False):
+		'''GET a url and return its parsed JSON, revalidating any cached copy.
+
+		When a cache is installed the last 200 response for url is stored
+		together with its ETag, Last-Modified and resourceVersion.  Later
+		requests send If-None-Match/If-Modified-Since and, on a 304 Not
+		Modified, the cached body is used instead of downloading it again.
+		Any other status raises KubernetesError, as the list methods do.
+
+		Args:
+		  url:
+		  	The web location we want to retrieve.
+		  model:
+		  	A model class to decode the JSON into with NewFromJsonDict.
+			If the object cache already holds this url at the same version
+			the cached instance is returned without decoding. [Optional]
+		  lazy:
+		  	Passed to model.NewFromJsonDict to defer decoding nested
+			objects until they are accessed. [Optional]
+		'''
+		key = self._GetCacheKey(url)
+		meta, body = self._GetCacheEntry(key)
+
+		headers = {}
+		if meta.get('etag'):
+			headers['If-None-Match'] = meta['etag']
+		if meta.get('lastModified'):
+			headers['If-Modified-Since'] = meta['lastModified']
+
+		response = self._RequestUrl(url, 'GET', headers=headers)
+		if response.status_code == 304 and body is not None:
+			version = meta.get('resourceVersion') or meta.get('etag')
+			if model is not None:
+				obj = self._GetCachedObject(key, version)
+				if obj is not None:
+					return obj
+			data = self._ParseAndCheckKubernetes(str(body))
+		elif response.status_code != 200:
+			raise KubernetesError({'message': 'get failed with status %d [%s]' %
+				(response.status_code, response.content)})
+		else:
+			data = self._ParseAndCheckKubernetes(response.content)
+			version = None
+			if isinstance(data, dict):
+				version = data.get('resourceVersion')
+			version = version or response.headers.get('ETag')
+			self._SetCacheEntry(key, response, data)
+
+		if model is None:
+			return data
+		obj = self._GetCachedObject(key, version)
+		if obj is None:
+			if lazy:
+				obj = model.NewFromJsonDict(data, lazy=True)
+			else:
+				obj = model.NewFromJsonDict(data)
+			if self._object_cache and version is not None:
+				self._object_cache.Set(key, (version, obj))
+		return obj
+
+	def _GetList(self, url, model, raw=False, fields=None, lazy=False):
+		'''GET a list url and return it decoded into model, or as parsed JSON
+		if raw is True or fields are given.
+		'''
+		if not raw and fields is None:
+			return self._GetJson(url, model, lazy=lazy)
+		return self._DecodeList(self._GetJson(url), model, raw=True, fields=fields)
+
+	def _DecodeList(self, data, model, raw=False, fields=None, lazy=False):
+		'''Decode a parsed list into model unless raw is True or fields are
+		given.  With fields, every item is replaced by its projection onto
+		those field paths.
+		'''
+		if fields is not None:
+			if isinstance(data, dict) and data.get('items'):
+				project = _CompileProjection(fields)
+				items = data['items']
+				for i in xrange(len(items)):
+					items[i] = project(items[i])
+			return data
+		if raw:
+			return data
+		if lazy:
+			return model.NewFromJsonDict(data, lazy=True)
+		return model.NewFromJsonDict(data)
+
+	def _IterPages(self, path, model, page_size, raw=False, fields=None,
+			namespace=None, label_selector=None, field_selector=None, lazy=False):
+		'''GET a list one page of page_size items at a time, following the
+		continue token of each page, and yield the pages decoded as by
+		_DecodeList.
+		'''
+		if page_size < 1:
+			raise KubernetesError({'message': 'page_size must be positive, got %s' % page_size})
+		token = None
+		while True:
+			url = self._BuildListUrl(path, namespace, label_selector, field_selector,
+				limit=page_size, **{'continue': token})
+			response = self._RequestUrl(url, 'GET')
+			if response.status_code != 200:
+				raise KubernetesError({'message': 'list failed with status %d [%s]' %
+					(response.status_code, response.content)})
+			data = self._ParseAndCheckKubernetes(response.content)
+			items = data.get('items') or []
+			token = data.get('continue') or (data.get('metadata') or {}).get('continue')
+			if not token and len(items) > page_size:
+				# The server ignored limit; emulate paging over the full list
+				for start in xrange(0, len(items), page_size):
+					page = dict(data)
+					page['items'] = items[start:start + page_size]
+					yield self._DecodeList(page, model, raw, fields, lazy)
+				return
+			yield self._DecodeList(data, model, raw, fields, lazy)
+			if not token:
+				return
+
+	def _TimedList(self, method, namespace):
+		start = time.time()
+		items = method(namespace=namespace)
+		return items, time.time() - start
+
+	def _IterPageItems(self, pages):
+		'''Yield the items of every page from _IterPages.'''
+		for page in pages:
+			if isinstance(page, dict):
+				items = page.get('items')
+			else:
+				items = page.Items
+			for item in items or ():
+				yield item
+
+	def _GetCachedObject(self, key, version):
+		if not self._object_cache or version is None:
+			return None
+		entry = self._object_cache.Get(key)
+		if entry is not None and entry[0] == version:
+			return entry[1]
+		return None
+
+	def _IterJson(self, url, model, lazy=False, raw=False, fields=None):
+		'''GET a list url and yield its items decoded into model as they arrive.
+
+		If raw is True the parsed JSON of each item is yielded instead, and
+		if fields are given its projection onto those field paths.
+		'''
+		project = None
+		if fields is not None:
+			project = _CompileProjection(fields)
+		response = self._RequestUrl(url, 'GET', stream=True)
+		try:
+			if response.status_code != 200:
+				raise KubernetesError({'message': 'list failed with status %d [%s]' %
+					(response.status_code, response.content)})
+			chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+			for item in _IterJsonArray(chunks, 'items', self._json.JSONDecoder()):
+				if project is not None:
+					yield project(item)
+				elif raw:
+					yield item
+				elif lazy:
+					yield model.NewFromJsonDict(item, lazy=True)
+				else:
+					yield model.NewFromJsonDict(item)
+		except ValueError as e:
+			raise KubernetesError({'message': 'parsing error [%s]' % e})
+		except requests.RequestException as e:
+			raise KubernetesError(str(e))
+		finally:
+			response.close()
+
+	def _Watch(self, url, model, lazy=False):
+		'''GET a watch url and yield its events as (type, model instance).
+
+		The server sends one JSON object per line.  An ERROR event, such as
+		the requested resourceVersion being too old, raises KubernetesError.
+		'''
+		response = self._RequestUrl(url, 'GET', stream=True)
+		try:
+			if response.status_code != 200:
+				raise KubernetesError({'message': 'watch failed with status %d [%s]' %
+					(response.status_code, response.content)})
+			for line in response.iter_lines():
+				if not line:
+					continue
+				event = self._ParseAndCheckKubernetes(line)
+				if event.get('type') == 'ERROR':
+					raise KubernetesError(event.get('object') or {'message': 'watch error'})
+				if lazy:
+					yield event.get('type'), model.NewFromJsonDict(event['object'], lazy=True)
+				else:
+					yield event.get('type'), model.NewFromJsonDict(event['object'])
+		except requests.RequestException as e:
+			raise KubernetesError(str(e))
+		finally:
+			response.close()
+
+	def _GetCacheKey(self, url):
+		return '%s@%s' % (self._user_id, url)
+
+	def _GetCacheEntry(self, key):
+		'''Return the (metadata dict, body) stored under key.
+
+		An entry is a single line of JSON metadata followed by the raw body.
+		Caches offering GetMapped are read through a memory map, and body is
+		then a buffer over the mapping, so only the metadata line is copied
+		unless the body actually has to be decoded.  Missing or unreadable
+		entries yield ({}, None).
+		'''
+		if not self._cache:
+			return {}, None
+		if hasattr(self._cache, 'GetMapped'):
+			entry = self._cache.GetMapped(key)
+		else:
+			entry = self._cache.Get(key)
+		if not entry:
+			return {}, None
+		offset = entry.find('\n')
+		try:
+			meta = simplejson.loads(entry[:offset])
+		except ValueError:
+			return {}, None
+		return meta, buffer(entry, offset + 1)
+
+	def _SetCacheEntry(self, key, response, data):
+		if not self._cache:
+			return
+		meta = {
+			'etag': response.headers.get('ETag'),
+			'lastModified': response.headers.get('Last-Modified')}
+		if isinstance(data, dict):
+			meta['resourceVersion'] = data.get('resourceVersion')
+		if not meta['etag'] and not meta['lastModified']:
+			# Nothing to revalidate against, so the entry could never be used
+			return
+		self._cache.Set(key, '%s\n%s' % (simplejson.dumps(meta), response.content))
 
 	def _ParseAndCheckKubernetes(self, json):
 		'''Try and parse the JSON returned from Kubernetes and return
@@ -298,7 +1119,7 @@ class Api(object):
 		'''
 
 		try:
-			data = simplejson.loads(json)
+			data = self._json.loads(json)
 		except ValueError:
 			raise KubernetesError({'message': 'parsing error ['+json+']'})
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''A non-blocking variant of kubernetes.Api'''
+
+from multiprocessing.pool import ThreadPool
+
+from kubernetes import Api
+
+class AsyncApi(object):
+	'''A python interface into the Kubernetes API whose calls do not block.
+
+	An AsyncApi wraps a kubernetes.Api.  GetPods, GetReplicationControllers,
+	GetServices, GetMinions, GetEvents and GetSnapshot take the same
+	arguments as in kubernetes.Api, but instead of the decoded model object
+	they return an AsyncResult; call its get() method to wait for the
+	decoded object (or the KubernetesError raised while fetching it).  Any
+	other attribute, including the Iter*, Iter*Pages and Watch* generators,
+	is looked up on the wrapped Api and blocks as it does there.  At most
+	max_concurrency requests are in flight at once, the rest are queued,
+	and all of them share one connection pool and the rate_limiter, if one
+	is given.
+
+	An AsyncApi is not a kubernetes.Api; give GetApi() to code expecting
+	one, such as kubernetes.Informer.
+	'''
+	def __init__(self, max_concurrency=10, api=None, **kwargs):
+		'''Instantiate a new kubernetes.AsyncApi object
+
+		Args:
+		  max_concurrency:
+		  	The maximum number of requests in flight at the same time.
+			Defaults to 10. [Optional]
+		  api:
+		  	The kubernetes.Api to wrap.  Defaults to a new one built from
+			kwargs. [Optional]
+		  **kwargs:
+		  	Passed on to kubernetes.Api when api is not given.
+			pool_maxsize defaults to max_concurrency so that no request
+			waits for a connection.
+		'''
+		if api is None:
+			kwargs.setdefault('pool_maxsize', max_concurrency)
+			api = Api(**kwargs)
+		self._api = api
+		self._max_concurrency = max_concurrency
+		self._pool = ThreadPool(max_concurrency)
+
+	def __getattr__(self, name):
+		if name == '_api':
+			# Not set yet, e.g. while unpickling
+			raise AttributeError(name)
+		return getattr(self._api, name)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.Close()
+
+	def GetApi(self):
+		'''Return the wrapped kubernetes.Api, whose methods block.'''
+		return self._api
+
+	def GetPods(self, *args, **kwargs):
+		'''List all pods on this cluster without blocking
+
+		Takes the same arguments as kubernetes.Api.GetPods.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.PodList, or to the parsed
+		  JSON if raw or fields are given
+		'''
+		return self._Submit(self._api.GetPods, *args, **kwargs)
+
+	def GetReplicationControllers(self, *args, **kwargs):
+		'''List all replicationControllers on this cluster without blocking
+
+		Takes the same arguments as kubernetes.Api.GetReplicationControllers.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.ReplicationControllerList, or to the parsed
+		  JSON if raw or fields are given
+		'''
+		return self._Submit(self._api.GetReplicationControllers, *args, **kwargs)
+
+	def GetServices(self, *args, **kwargs):
+		'''List all services on this cluster without blocking
+
+		Takes the same arguments as kubernetes.Api.GetServices.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.ServiceList, or to the parsed
+		  JSON if raw or fields are given
+		'''
+		return self._Submit(self._api.GetServices, *args, **kwargs)
+
+	def GetMinions(self, *args, **kwargs):
+		'''List all minions on this cluster without blocking
+
+		Takes the same arguments as kubernetes.Api.GetMinions.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.MinionList, or to the
+		  parsed JSON if raw or fields are given
+		'''
+		return self._Submit(self._api.GetMinions, *args, **kwargs)
+
+	def GetEvents(self, *args, **kwargs):
+		'''List all events on this cluster without blocking
+
+		Takes the same arguments as kubernetes.Api.GetEvents.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.EventList, or to the
+		  parsed JSON if raw or fields are given
+		'''
+		return self._Submit(self._api.GetEvents, *args, **kwargs)
+
+	def GetSnapshot(self, *args, **kwargs):
+		'''Take a kubernetes.ClusterSnapshot without blocking
+
+		Takes the same arguments as kubernetes.Api.GetSnapshot.
+
+		Returns:
+		  An AsyncResult resolving to a kubernetes.ClusterSnapshot
+		'''
+		return self._Submit(self._api.GetSnapshot, *args, **kwargs)
+
+	def Close(self):
+		'''Wait for queued requests to finish, then close pooled connections.'''
+		self._pool.close()
+		self._pool.join()
+		self._api.Close()
+
+	def _Submit(self, func, *args, **kwargs):
+		return self._pool.apply_async(func, args, kwargs)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Column oriented views of list objects for cluster wide aggregation.'''
+
+from array import array
+from itertools import compress
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+_NUMPY_TYPES = {'O': object, 'l': 'int64', 'd': 'float64'}
+
+def _Path(*names):
+	'''Return a function following names through nested dicts or model
+	attributes, returning None as soon as a step is missing.'''
+	def get(obj):
+		for name in names:
+			if obj is None:
+				return None
+			if isinstance(obj, dict):
+				obj = obj.get(name)
+			else:
+				obj = getattr(obj, name, None)
+		return obj
+	return get
+
+def _Count(*names):
+	get = _Path(*names)
+	return lambda obj: len(get(obj) or ())
+
+def _Sum(names, name):
+	get = _Path(*names)
+	get_value = _Path(name)
+	return lambda obj: sum([get_value(item) or 0 for item in get(obj) or ()])
+
+def _CoerceNumbers(typecode, values):
+	'''Convert values, which may be numeric strings, to int or float for a
+	typed column; return None if one of them is not such a number (e.g. a
+	quantity like '4Gi').
+	'''
+	convert = int if typecode == 'l' else float
+	numbers = []
+	try:
+		for value in values:
+			number = convert(value or 0)
+			if typecode == 'l' and isinstance(value, float) and number != value:
+				return None
+			numbers.append(number)
+	except (TypeError, ValueError):
+		return None
+	return numbers
+
+def _MakeColumn(typecode, values):
+	if typecode != 'O':
+		numbers = _CoerceNumbers(typecode, values)
+		if numbers is None:
+			# Keep the column whole rather than fail on one odd value
+			typecode = 'O'
+		else:
+			values = numbers
+	if numpy is not None:
+		column = numpy.empty(len(values), dtype=_NUMPY_TYPES[typecode])
+		if typecode == 'O':
+			# Assign one by one so that dict and list values are not
+			# taken for nested sequences
+			for (i, value) in enumerate(values):
+				column[i] = value
+		else:
+			column[:] = values
+		return column
+	if typecode == 'O':
+		return values
+	return array(typecode, values)
+
+class _Columns(object):
+	'''Equal length columns holding one field of every item of a list.
+
+	Numeric columns are NumPy arrays when NumPy is installed and
+	array.array instances otherwise; other columns are NumPy object
+	arrays or lists.  Subclasses describe their columns in _COLUMNS as
+	(name, typecode, JSON getter, model getter) tuples, typecode being
+	'l' for integers, 'd' for floats and 'O' for anything else.  Numeric
+	strings are converted; a numeric column holding any other value is
+	built as an object column instead.
+	'''
+	_COLUMNS = ()
+
+	def __init__(self, columns, size):
+		self._columns = columns
+		self._size = size
+
+	def __len__(self):
+		return self._size
+
+	def __getitem__(self, name):
+		return self.Column(name)
+
+	@classmethod
+	def NewFromJsonDict(cls, data):
+		'''Build the columns from a parsed JSON list, such as returned by
+		the kubernetes.Api list methods with raw=True.
+		'''
+		return cls._Build(data.get('items') or [], 2)
+
+	@classmethod
+	def NewFromList(cls, items):
+		'''Build the columns from a list object, e.g. a kubernetes.PodList.'''
+		return cls._Build(items.Items or [], 3)
+
+	@classmethod
+	def _Build(cls, items, getter):
+		columns = {}
+		for column in cls._COLUMNS:
+			get = column[getter]
+			columns[column[0]] = _MakeColumn(column[1], [get(item) for item in items])
+		return cls(columns, len(items))
+
+	def GetColumnNames(self):
+		'''Return the names of the stored columns.'''
+		return [column[0] for column in self._COLUMNS]
+
+	def Column(self, name):
+		'''Return the column called name.
+
+		'Labels.<key>' returns the value of label <key> of every item, or
+		None where it is not set.
+		'''
+		if name.startswith('Labels.') and 'Labels' in self._columns:
+			key = name[len('Labels.'):]
+			return _MakeColumn('O', [(labels or {}).get(key) for labels in self._columns['Labels']])
+		try:
+			return self._columns[name]
+		except KeyError:
+			raise KeyError('no column %s in %s' % (name, type(self).__name__))
+
+	def Mask(self, **conditions):
+		'''Return a boolean mask of the items equal to every condition.
+
+		Conditions are column names (including 'Labels.<key>') mapped to
+		the required value.  Labels={...} matches items carrying all of
+		the given labels.
+		'''
+		labels = conditions.pop('Labels', None) or {}
+		for (key, value) in labels.iteritems():
+			conditions['Labels.%s' % key] = value
+		mask = None
+		for (name, value) in conditions.iteritems():
+			column = self.Column(name)
+			if numpy is not None:
+				matches = column == value
+				mask = matches if mask is None else mask & matches
+			else:
+				matches = [item == value for item in column]
+				mask = matches if mask is None else [a and b for (a, b) in zip(mask, matches)]
+		if mask is None:
+			mask = [True] * self._size
+			if numpy is not None:
+				mask = numpy.array(mask, dtype=bool)
+		return mask
+
+	def Filter(self, mask=None, **conditions):
+		'''Return a view of the same kind holding only some items.
+
+		Args:
+		  mask:
+		  	A sequence of booleans, one per item. [Optional]
+		  **conditions:
+		  	As for Mask, combined with mask. [Optional]
+		'''
+		selected = self.Mask(**conditions)
+		if mask is not None:
+			if numpy is not None:
+				selected = selected & numpy.asarray(mask, dtype=bool)
+			else:
+				selected = [a and bool(b) for (a, b) in zip(selected, mask)]
+		columns = {}
+		for (name, column) in self._columns.iteritems():
+			if numpy is not None:
+				columns[name] = column[selected]
+			elif isinstance(column, array):
+				columns[name] = array(column.typecode, compress(column, selected))
+			else:
+				columns[name] = list(compress(column, selected))
+		return type(self)(columns, len(columns[self._COLUMNS[0][0]]))
+
+	def GroupBy(self, key, column=None, how='count'):
+		'''Aggregate a column per distinct value of another one.
+
+		Args:
+		  key:
+		  	The column to group by, e.g. 'Host' or 'Labels.name'.
+		  column:
+		  	The numeric column to aggregate; not needed for 'count'.
+		  how:
+		  	One of 'count', 'sum' or 'mean'.  Defaults to 'count'.
+
+		Returns:
+		  A dict mapping each value of key to its aggregate.
+		'''
+		if how not in ('count', 'sum', 'mean'):
+			raise ValueError('unknown aggregation %s' % how)
+		if how != 'count' and column is None:
+			raise ValueError('%s needs a column to aggregate' % how)
+		keys = self.Column(key)
+		values = self.Column(column) if column is not None else None
+		if numpy is not None:
+			return self._GroupByNumpy(keys, values, how)
+		counts = {}
+		sums = {}
+		for i, group in enumerate(keys):
+			counts[group] = counts.get(group, 0) + 1
+			if values is not None:
+				sums[group] = sums.get(group, 0) + values[i]
+		if how == 'count':
+			return counts
+		if how == 'sum':
+			return sums
+		return dict([(group, float(sums[group]) / counts[group]) for group in counts])
+
+	def _GroupByNumpy(self, keys, values, how):
+		if not len(keys):
+			return {}
+		# Number the groups by hashing rather than numpy.unique, which has
+		# to sort and is slow on object arrays
+		index = {}
+		inverse = numpy.fromiter((index.setdefault(group, len(index)) for group in keys),
+			dtype='int64', count=len(keys))
+		groups = [None] * len(index)
+		for (group, i) in index.iteritems():
+			groups[i] = group
+		counts = numpy.bincount(inverse, minlength=len(groups))
+		if how == 'count':
+			result = counts
+		else:
+			result = numpy.bincount(inverse, weights=values, minlength=len(groups))
+			if how == 'mean':
+				result = result / counts
+			elif values.dtype.kind == 'i':
+				result = result.astype(values.dtype)
+		return dict(zip(groups, result.tolist()))
+
+class PodColumns(_Columns):
+	'''A columnar view of a kubernetes.PodList.
+
+	Columns:
+	  ID, Namespace, Labels, Host, HostIP, PodIP and Status, plus
+	  ContainerCount and the Memory and CPU requested by all containers
+	  of the desired state.
+	'''
+	_COLUMNS = (
+		('ID', 'O', _Path('id'), _Path('ID')),
+		('Namespace', 'O', _Path('namespace'), _Path('Namespace')),
+		('Labels', 'O', _Path('labels'), _Path('Labels')),
+		('Host', 'O', _Path('currentState', 'host'), _Path('CurrentState', 'Host')),
+		('HostIP', 'O', _Path('currentState', 'hostIP'), _Path('CurrentState', 'HostIP')),
+		('PodIP', 'O', _Path('currentState', 'podIP'), _Path('CurrentState', 'PodIP')),
+		('Status', 'O', _Path('currentState', 'status'), _Path('CurrentState', 'Status')),
+		('ContainerCount', 'l',
+			_Count('desiredState', 'manifest', 'containers'),
+			_Count('DesiredState', 'Manifest', 'Containers')),
+		('Memory', 'l',
+			_Sum(('desiredState', 'manifest', 'containers'), 'memory'),
+			_Sum(('DesiredState', 'Manifest', 'Containers'), 'Memory')),
+		('CPU', 'l',
+			_Sum(('desiredState', 'manifest', 'containers'), 'cpu'),
+			_Sum(('DesiredState', 'Manifest', 'Containers'), 'CPU')))
+
+class MinionColumns(_Columns):
+	'''A columnar view of a kubernetes.MinionList.
+
+	Columns:
+	  ID, HostIP, and the Memory and CPU capacity of each minion.
+	'''
+	_COLUMNS = (
+		('ID', 'O', _Path('id'), _Path('ID')),
+		('HostIP', 'O', _Path('hostIP'), _Path('HostIP')),
+		('Memory', 'l', _Path('resources', 'capacity', 'memory'), _Path('Resources', 'Capacity', 'memory')),
+		('CPU', 'l', _Path('resources', 'capacity', 'cpu'), _Path('Resources', 'Capacity', 'cpu')))
+
+class EventColumns(_Columns):
+	'''A columnar view of a kubernetes.EventList.
+
+	Columns:
+	  ID, Namespace, CreationTimestamp, Status, Reason, Source, and the
+	  ObjectKind and ObjectName of the involved object.
+	'''
+	_COLUMNS = (
+		('ID', 'O', _Path('id'), _Path('ID')),
+		('Namespace', 'O', _Path('namespace'), _Path('Namespace')),
+		('CreationTimestamp', 'O', _Path('creationTimestamp'), _Path('CreationTimestamp')),
+		('Status', 'O', _Path('status'), _Path('Status')),
+		('Reason', 'O', _Path('reason'), _Path('Reason')),
+		('Source', 'O', _Path('source'), _Path('Source')),
+		('ObjectKind', 'O', _Path('involvedObject', 'kind'), _Path('InvolvedObject', 'Kind')),
+		('ObjectName', 'O', _Path('involvedObject', 'name'), _Path('InvolvedObject', 'Name')))
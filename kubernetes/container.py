@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _ValueList, _Model, _ModelList, _CompileModel
 
 class PulllPolicy(object):
 	'''PullPolicy describes a policy for if/when to pull a container image
@@ -54,6 +55,24 @@ class Container(object):
 	Container.ImagePullPolicy
 
 	"""
+	__slots__ = ('Name', 'Image', 'Command', 'WorkingDir', 'Ports', 'Env',
+		'Memory', 'CPU', 'VolumeMounts', 'LivenessProb', 'Lifecycle',
+		'Privileged', 'ImagePullPolicy')
+	_FIELDS = (
+		_Value('Name', 'name'),
+		_Value('Image', 'image'),
+		_ValueList('Command', 'command'),
+		_Value('WorkingDir', 'workingDir'),
+		_ModelList('Ports', 'ports', 'Port'),
+		_ModelList('Env', 'env', 'EnvVar'),
+		_Value('Memory', 'memory'),
+		_Value('CPU', 'cpu'),
+		_ModelList('VolumeMounts', 'volumeMounts', 'VolumeMount'),
+		_Model('LivenessProb', 'livenessProbe', 'LivenessProbe'),
+		_Model('Lifecycle', 'lifecycle', 'Lifecyle'),
+		_Value('Privileged', 'privileged', False),
+		_Value('ImagePullPolicy', 'imagePullPolicy'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Container.
 		
@@ -139,95 +158,8 @@ class Container(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Container instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Container instance
-		'''
-		data = {}
-		if self.Name:
-			data['name'] = self.Name
-		if self.Image:
-			data['image'] = self.Image
-		if self.Command:
-			data['command'] = self.Command
-		if self.WorkingDir:
-			data['workingDir'] = self.WorkingDir
-		if self.Ports:
-			data['ports'] = [port.AsDict() for port in self.Ports]
-		if self.Env:
-			data['env'] = [env.AsDict() for env in self.Env]
-		if self.Memory:
-			data['memory'] = self.Memory
-		if self.CPU:
-			data['cpu'] = self.CPU
-		if self.VolumeMounts:
-			data['volumeMounts'] = [volumeMount.AsDict() for volumeMount in self.VolumeMounts]
-		if self.LivenessProb:
-			data['livenessProb'] = self.LivenessProb
-		if self.Lifecycle:
-			data['lifecycle'] = self.Lifecycle
-		if self.Privileged:
-			data['privileged'] = self.Privileged
-		if self.ImagePullPolicy:
-			data['imagePullPolicy'] = self.ImagePullPolicy
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Container instance
-		'''
-
-		command = None
-		ports = None
-		env = None
-		volumeMounts = None
-		livenessProb = None
-		lifecyle = None
-
-		if 'command' in data:
-			command = [c for c in data['command']]
-
-		if 'ports' in data:
-			from kubernetes import Port
-			ports = [Port.NewFromJsonDict(port) for port in data['ports']]
+_CompileModel(Container)
 
-		if 'env' in data:
-			from kubernetes import EnvVar
-			env = [EnvVar.NewFromJsonDict(e) for e in data['env']]
-
-		if 'volumeMounts' in data:
-			from kubernetes import VolumeMount
-			volumeMounts = [VolumeMount.NewFromJsonDict(volumeMount) for volumeMount in data['volumeMount']]
-
-		if 'livenessProb' in data:
-			from kubernetes import LivenessProb
-			livenessProb = LivenessProb.NewFromJsonDict(data['livenessProb'])
-	
-		if 'lifecyle' in data:
-			from kubernetes import Lifecyle
-			lifecyle = Lifecyle.NewFromJsonDict(data['lifecyle'])
-
-		return Container(Name=data.get('name', None),
-					Image=data.get('image', None),
-					Command=command,
-					WorkingDir=data.get('workingDir', None),
-					Ports=ports,
-					Env=env,
-					Memory=data.get('memory', None),
-					CPU=data.get('cpu', None),
-					VolumeMounts=volumeMounts,
-					LivenessProb=livenessProb,
-					Lifecyle=lifecyle,
-					Privileged=data.get('privileged', False),
-					ImagePullPolicy=data.get('imagePullPolicy', None))
 
 class Handler(object):
 	'''A Class representing the Handler structure used by the kubernetes API
@@ -241,6 +173,11 @@ class Handler(object):
 	Handler.HTTPGet
 
 	'''
+	__slots__ = ('Exec', 'HTTPGet')
+	_FIELDS = (
+		_Model('Exec', 'exec', 'ExecAction'),
+		_Model('HTTPGet', 'httpGet', 'HTTPGetAction'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes Handler.
 
@@ -288,45 +225,7 @@ class Handler(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Handler instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Handler instance
-		'''
-		data = {}
-		if self.Exec:
-			data['exec'] = self.Exec.AsDict()
-		if self.HTTPGet:
-			data['httpGet'] = self.HTTPGet.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.Handler instance
-		'''
-
-		Exec = None
-		httpGet = None
-
-		if 'exec' in data:
-			from kubernetes import ExecAction
-			Exec = ExecAction.NewFromJsonDict(data['exec'])
-
-		if 'httpGet' in data:
-			from kubernetes import HTTPGetAction
-			httpGet = HTTPGetAction.NewFromJsonDict(data['httpGet'])
-
-		return Handler(Exec=Exec,
-			HTTPGet=httpGet)
+_CompileModel(Handler)
 
 
 class Lifecyle(object):
@@ -342,6 +241,11 @@ class Lifecyle(object):
 	Lifecyle.PreStop
 
 	'''
+	__slots__ = ('PostStart', 'PreStop')
+	_FIELDS = (
+		_Model('PostStart', 'postStart', 'Handler'),
+		_Model('PreStop', 'preStop', 'Handler'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes Lifecyle.
 
@@ -390,42 +294,5 @@ class Lifecyle(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Lifecyle instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Lifecyle instance
-		'''
-		data = {}
-		if self.PostStart:
-			data['postStart'] = self.PostStart.AsDict()
-		if self.PreStop:
-			data['preStop'] = self.PreStop.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.Lifecyle instance
-		'''
-
-		postStart = None
-		preStop = None
-
-		if 'postStart' in data:
-			from kubernetes import Handler
-			postStart = Handler.NewFromJsonDict(data['postStart'])
-
-		if 'preStop' in data:
-			from kubernetes import Handler
-			preStop = Handler.NewFromJsonDict(data['preStop'])
+_CompileModel(Lifecyle)
 
-		return Lifecyle(PostStart=postStart,
-			PreStop=preStop)
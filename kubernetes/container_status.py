@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _CompileModel
 
 class TypeMeta(object):
 	'''A Class representing the TypeMeta structure used by the kubernetes API
@@ -34,6 +35,19 @@ class TypeMeta(object):
 	TypeMeta.Annotations
 
 	'''
+	__slots__ = ('Kind', 'ID', 'UID', 'CreationTimestamp', 'SelfLink',
+		'ResourceVersion', 'APIVersion', 'Namespace', 'Annotations')
+	_FIELDS = (
+		_Value('Kind', 'kind'),
+		_Value('ID', 'id'),
+		_Value('UID', 'uid'),
+		_Value('CreationTimestamp', 'creationTimestamp'),
+		_Value('SelfLink', 'selfLink'),
+		_Value('ResourceVersion', 'resourceVersion'),
+		_Value('APIVersion', 'apiVersion'),
+		_Value('Namespace', 'namespace'),
+		_Value('Annotations', 'annotations'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes TypeMeta.
 
@@ -102,54 +116,7 @@ class TypeMeta(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.TypeMeta instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.TypeMeta instance
-		'''
-		data = {}
-		if self.Kind:
-			data['kind'] = self.Kind
-		if self.ID:
-			data['id'] = self.ID
-		if self.UID:
-			data['uid'] = self.UID
-		if self.CreationTimestamp:
-			data['creationTimestamp'] = self.CreationTimestamp
-		if self.SelfLink:
-			data['selfLink'] = self.SelfLink
-		if self.ResourceVersion:
-			data['resourceVersion'] = self.ResourceVersion
-		if self.APIVersion:
-			data['apiVersion'] = self.APIVersion
-		if self.Namespace:
-			data['namespace'] = self.Namespace
-		if self.Annotations:
-			data['annotations'] = self.Annotations
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.TypeMeta instance
-		'''
-		return TypeMeta(kind=data.get('kind', None),
-			id=data.get('id', None),
-			uid=data.get('uid', None),
-			creationTimestamp=data.get('creationTimestamp', None),
-			selfLink=data.get('selfLink', None),
-			resourceVersion=data.get('resourceVersion', None),
-			apiVersion=data.get('apiVersion', None),
-			namespace=data.get('namespace', None),
-			annotations=data.get('annotations', None))
+_CompileModel(TypeMeta)
 
 
 class PodStatus(object):
@@ -177,6 +144,9 @@ class ContainerStateWaiting(object):
 	ContainerStateWaiting.Reason
 
 	'''
+	__slots__ = ('Reason',)
+	_FIELDS = (_Value('Reason', 'reason'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes ContainerStateWaiting.
 
@@ -219,30 +189,7 @@ class ContainerStateWaiting(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerStateWaiting instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerStateWaiting instance
-		'''
-		data = {}
-		if self.Reason:
-			data['reason'] = self.Reason
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.ContainerStateWaiting instance
-		'''
-		return ContainerStateWaiting(Reason=data.get('reason', None))
+_CompileModel(ContainerStateWaiting)
 
 
 class ContainerStateRunning(object):
@@ -253,6 +200,9 @@ class ContainerStateRunning(object):
 	ContainerStateRunning.StartedAt
 
 	'''
+	__slots__ = ('StartedAt',)
+	_FIELDS = (_Value('StartedAt', 'startedAt'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes ContainerStateRunning.
 
@@ -294,30 +244,7 @@ class ContainerStateRunning(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerStateRunning instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerStateRunning instance
-		'''
-		data = {}
-		if self.StartedAt:
-			data['startedAt'] = self.StartedAt
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.ContainerStateRunning instance
-		'''
-		return ContainerStateRunning(StartedAt=data.get('startedAt', None))
+_CompileModel(ContainerStateRunning)
 
 
 class ContainerStateTerminated(object):
@@ -334,6 +261,14 @@ class ContainerStateTerminated(object):
 	ContainerStateTerminated.FinishedAt
 
 	'''
+	__slots__ = ('ExitCode', 'Signal', 'Reason', 'StartedAt', 'FinishedAt')
+	_FIELDS = (
+		_Value('ExitCode', 'exitCode'),
+		_Value('Signal', 'signal'),
+		_Value('Reason', 'reason'),
+		_Value('StartedAt', 'startedAt'),
+		_Value('FinishedAt', 'finishedAt'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes ContainerStateTerminated.
 
@@ -387,42 +322,7 @@ class ContainerStateTerminated(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerStateTerminated instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerStateTerminated instance
-		'''
-		data = {}
-		if self.ExitCode:
-			data['exitCode'] = self.ExitCode
-		if self.Signal:
-			data['signal'] = self.Signal
-		if self.Reason:
-			data['reason'] = self.Reason
-		if self.StartedAt:
-			data['startedAt'] = self.StartedAt
-		if self.FinishedAt:
-			data['finishedAt'] = self.FinishedAt
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.ContainerStateTerminated instance
-		'''
-		return ContainerStateTerminated(ExitCode=data.get('exitCode', None),
-			Signal=data.get('signal', None),
-			Reason=data.get('reason', None),
-			StartedAt=data.get('startedAt', None),
-			FinishedAt=data.get('finishedAt', None))
+_CompileModel(ContainerStateTerminated)
 
 
 class ContainerState(object):
@@ -435,6 +335,12 @@ class ContainerState(object):
 	ContainerState.Termination
 
 	"""
+	__slots__ = ('Waiting', 'Running', 'Termination')
+	_FIELDS = (
+		_Model('Waiting', 'waiting', 'ContainerStateWaiting'),
+		_Model('Running', 'running', 'ContainerStateRunning'),
+		_Model('Termination', 'termination', 'ContainerStateTerminated'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ContainerState.
 		
@@ -485,52 +391,7 @@ class ContainerState(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerState instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerState instance
-		'''
-		data = {}
-		if self.Waiting:
-			data['waiting'] = self.Waiting.AsDict()
-		if self.Running:
-			data['running'] = self.Running.AsDict()
-		if self.Termination:
-			data['termination'] = self.Termination.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ContainerState instance
-		'''
-
-		waiting = None
-		running = None
-		termination = None
-
-		if 'waiting' in data:
-			from kubernetes import ContainerStateWaiting
-			waiting = ContainerStateWaiting.NewFromJsonDict(data['waiting'])
-
-		if 'running' in data:
-			from kubernetes import ContainerStateRunning
-			running = ContainerStateRunning.NewFromJsonDict(data['running'])
-
-		if 'termination' in data:
-			from kubernetes import ContainerStateTerminated
-			termination = ContainerStateTerminated.NewFromJsonDict(data['termination'])
-
-		return ContainerState(
-					Waiting=waiting,
-					Running=running,
-					Termination=termination)
+_CompileModel(ContainerState)
 
 
 class ContainerStatus(object):
@@ -544,6 +405,13 @@ class ContainerStatus(object):
 	ContainerStatus.Image
 
 	"""
+	__slots__ = ('State', 'RestartCount', 'PodIP', 'Image')
+	_FIELDS = (
+		_Model('State', 'state', 'ContainerState'),
+		_Value('RestartCount', 'restartCount'),
+		_Value('PodIP', 'podIP'),
+		_Value('Image', 'image'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ContainerStatus.
 		
@@ -601,42 +469,5 @@ class ContainerStatus(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerStatus instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerStatus instance
-		'''
-		data = {}
-		if self.State:
-			data['state'] = self.State.AsDict()
-		if self.RestartCount:
-			data['restartCount'] = self.RestartCount
-		if self.PodIP:
-			data['podIP'] = self.PodIP
-		if self.Image:
-			data['image'] = self.Image
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ContainerStatus instance
-		'''
-
-		state = None
-
-		if 'state' in data:
-			from kubernetes import ContainerState
-			state = ContainerState.NewFromJsonDict(data['state'])
+_CompileModel(ContainerStatus)
 
-		return ContainerStatus(
-					State=state,
-					RestartCount=data.get('restartCount', None),
-					PodIP=data.get('podIP', None),
-					Image=data.get('image', None))
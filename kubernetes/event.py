@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _ModelList, _CompileModel
 
 from kubernetes import TypeMeta
 class ServerOp(TypeMeta):
@@ -26,6 +27,9 @@ class ServerOp(TypeMeta):
 
 
 	"""
+	__slots__ = ()
+	_FIELDS = ()
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ServerOp.
 		
@@ -63,36 +67,8 @@ class ServerOp(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(ServerOp, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ServerOp instance.
-
-		The return values uses the same key names as the JSON representation.
+_CompileModel(ServerOp)
 
-		Returns:
-		  A dict representing this kubernetes.ServerOp instance
-		'''
-		data = {}
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ServerOp instance
-		'''
-
-		return ServerOp(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None))
 
 class ServerOpList(TypeMeta):
 	"""A Class representing the ServerOpList structure used by the kubernetes API
@@ -104,6 +80,9 @@ class ServerOpList(TypeMeta):
 	ServerOpList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'ServerOp'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ServerOpList.
 		
@@ -150,46 +129,7 @@ class ServerOpList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(ServerOpList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ServerOpList instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ServerOpList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [serverOp.AsDict() for serverOp in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ServerOpList instance
-		'''
-
-		items = None
-
-		if 'items' in data:
-			from kubernetes import ServerOp
-			items = [ServerOp.NewFromJsonDict(serverop) for serverop in data['items']]
-
-		return ServerOpList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Items=items)
+_CompileModel(ServerOpList)
 
 
 class ObjectReference(object):
@@ -208,6 +148,17 @@ class ObjectReference(object):
 	ObjectReference.FieldPath
 
 	"""
+	__slots__ = ('Kind', 'Namespace', 'Name', 'UID', 'APIVersion',
+		'ResourceVersion', 'FieldPath')
+	_FIELDS = (
+		_Value('Kind', 'kind'),
+		_Value('Namespace', 'namespace'),
+		_Value('Name', 'name'),
+		_Value('UID', 'uid'),
+		_Value('APIVersion', 'apiVersion'),
+		_Value('ResourceVersion', 'resourceVersion'),
+		_Value('FieldPath', 'fieldPath'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ObjectReference.
 		
@@ -274,48 +225,7 @@ class ObjectReference(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ObjectReference instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ObjectReference instance
-		'''
-		data = {}
-		if self.Kind:
-			data['kind'] = self.Kind
-		if self.Namespace:
-			data['namespace'] = self.Namespace
-		if self.Name:
-			data['name'] = self.Name
-		if self.UID:
-			data['uid'] = self.UID
-		if self.APIVersion:
-			data['apiVersion'] = self.APIVersion
-		if self.ResourceVersion:
-			data['resourceVersion'] = self.ResourceVersion
-		if self.FieldPath:
-			data['fieldPath'] = self.FieldPath
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ObjectReference instance
-		'''
-
-		return ObjectReference(
-					Kind=data.get('kind', None),
-					Namespace=data.get('namespace', None),
-					Name=data.get('name', None),
-					UID=data.get('uid', None),
-					APIVersion=data.get('apiVersion', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					FieldPath=data.get('fieldPath', None))
+_CompileModel(ObjectReference)
 
 
 class Event(TypeMeta):
@@ -333,6 +243,14 @@ class Event(TypeMeta):
 	Event.Source
 
 	"""
+	__slots__ = ('InvolvedObject', 'Status', 'Reason', 'Message', 'Source')
+	_FIELDS = (
+		_Model('InvolvedObject', 'involvedObject', 'ObjectReference'),
+		_Value('Status', 'status'),
+		_Value('Reason', 'reason'),
+		_Value('Message', 'message'),
+		_Value('Source', 'source'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Event.
 		
@@ -407,58 +325,7 @@ class Event(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Event, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Event instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Event instance
-		'''
-		data = {}
-		if self.InvolvedObject:
-			data['involvedObject'] = self.InvolvedObject.AsDict()
-		if self.Status:
-			data['status'] = self.Status
-		if self.Reason:
-			data['reason'] = self.Reason
-		if self.Message:
-			data['message'] = self.Message
-		if self.Source:
-			data['source'] = self.Source
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Event instance
-		'''
-
-		involvedObject = None
-
-		if 'involvedObject' in data:
-			from kubernetes import ObjectReference
-			involvedObject = ObjectReference.NewFromJsonDict(data['involvedObject'])
-
-		return Event(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					InvolvedObject=involvedObject,
-					Status=data.get('status', None),
-					Reason=data.get('reason', None),
-					Message=data.get('message', None),
-					Source=data.get('source', None))
+_CompileModel(Event)
 
 
 class EventList(TypeMeta):
@@ -471,6 +338,9 @@ class EventList(TypeMeta):
 	EventList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'Event'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete EventList.
 		
@@ -517,43 +387,14 @@ class EventList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(EventList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.EventList instance.
+	def AsColumns(self):
+		'''A columnar view of this kubernetes.EventList instance.
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.EventList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [event.AsDict() for event in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
 		Returns:
-		  A kubernetes.EventList instance
+		  A kubernetes.EventColumns instance
 		'''
+		from kubernetes import EventColumns
+		return EventColumns.NewFromList(self)
 
-		items = None
-
-		if 'items' in data:
-			from kubernetes import Event
-			items = [Event.NewFromJsonDict(event) for event in data['items']]
-
-		return EventList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
+_CompileModel(EventList)
 
-					Items=items)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Keeps a local Store in sync with the cluster through the watch API.'''
+
+import logging
+import threading
+
+from kubernetes import KubernetesError, Store, PodStore
+
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
+# The Api methods used to list and to watch each kind of resource.
+RESOURCES = {
+	'pods': ('GetPods', 'WatchPods'),
+	'services': ('GetServices', 'WatchServices'),
+	'replicationControllers': ('GetReplicationControllers', 'WatchReplicationControllers'),
+	'minions': ('GetMinions', 'WatchMinions')}
+
+class Informer(object):
+	'''Lists a kind of resource once, then follows the watch stream from the
+	version of that list to keep a kubernetes.Store up to date.
+
+	The work happens on a background thread started by Start().  When the
+	watch stream ends it is reopened from the last version seen; when a
+	request fails the resources are listed again after retry_interval
+	seconds.
+
+	Example:
+	  informer = kubernetes.Informer(api, 'pods')
+	  informer.Start()
+	  informer.WaitForSync()
+	  pod = informer.GetStore().Get('default/frontend')
+	'''
+	def __init__(self, api, resource, store=None, retry_interval=1.0,
+			namespace=None, label_selector=None, field_selector=None):
+		'''Instantiate a new kubernetes.Informer object
+
+		Args:
+		  api:
+		  	The kubernetes.Api to list and watch with.  For a
+			kubernetes.AsyncApi pass its GetApi().
+		  resource:
+		  	One of 'pods', 'services', 'replicationControllers' or
+			'minions'.
+		  store:
+		  	The kubernetes.Store to fill.  Defaults to a new
+			kubernetes.PodStore for pods and a new kubernetes.Store
+			otherwise. [Optional]
+		  retry_interval:
+		  	Seconds to wait before listing again after an error.
+			Defaults to 1. [Optional]
+		  namespace, label_selector, field_selector:
+		  	Only keep the matching resources, as for kubernetes.Api.GetPods.
+			[Optional]
+		'''
+		if resource not in RESOURCES:
+			raise KubernetesError({'message': 'cannot watch %s' % resource})
+		list_method, watch_method = RESOURCES[resource]
+		self._list = getattr(api, list_method)
+		self._watch = getattr(api, watch_method)
+		self._resource = resource
+		self._selectors = {
+			'namespace': namespace,
+			'label_selector': label_selector,
+			'field_selector': field_selector}
+		if store is None:
+			store = PodStore() if resource == 'pods' else Store()
+		self._store = store
+		self._retry_interval = retry_interval
+		self._handlers = []
+		self._synced = threading.Event()
+		self._stopped = threading.Event()
+		self._thread = None
+
+	def GetStore(self):
+		'''Return the kubernetes.Store kept up to date by this informer.'''
+		return self._store
+
+	def AddEventHandler(self, handler):
+		'''Call handler(event_type, obj) after each watch event is applied
+		to the store.  Handlers run on the informer thread; an exception
+		raised by one is logged and does not stop the informer.
+		'''
+		self._handlers.append(handler)
+
+	def Start(self):
+		'''Start listing and watching on a background thread.'''
+		if self._thread is not None:
+			return
+		self._stopped.clear()
+		self._thread = threading.Thread(target=self._Run, name='informer-%s' % self._resource)
+		self._thread.daemon = True
+		self._thread.start()
+
+	def Stop(self, timeout=None):
+		'''Ask the background thread to stop and wait up to timeout seconds.
+
+		A thread blocked reading an idle watch stream stops at the next
+		event or when the request times out.
+		'''
+		self._stopped.set()
+		if self._thread is not None:
+			self._thread.join(timeout)
+			self._thread = None
+
+	def HasSynced(self):
+		'''Return True once the store holds a complete list.'''
+		return self._synced.is_set()
+
+	def WaitForSync(self, timeout=None):
+		'''Block until the first list is in the store; return HasSynced().'''
+		self._synced.wait(timeout)
+		return self._synced.is_set()
+
+	def _Run(self):
+		relist = True
+		resource_version = None
+		while not self._stopped.is_set():
+			try:
+				if relist:
+					resource_version = self._Relist()
+					relist = False
+				events = 0
+				for (event_type, obj) in self._watch(resource_version=resource_version, **self._selectors):
+					self._Apply(event_type, obj)
+					events += 1
+					if obj.ResourceVersion is not None:
+						resource_version = obj.ResourceVersion
+					if self._stopped.is_set():
+						return
+				if not events:
+					# Do not hammer a server that keeps closing the stream
+					self._stopped.wait(self._retry_interval)
+			except KubernetesError as e:
+				_log.warning('informer for %s: %s', self._resource, e)
+				relist = True
+				self._stopped.wait(self._retry_interval)
+			except Exception:
+				_log.exception('informer for %s failed, listing again', self._resource)
+				relist = True
+				self._stopped.wait(self._retry_interval)
+
+	def _Relist(self):
+		# The list raises KubernetesError on failure; keep the store as it
+		# was rather than replacing it with the items of an error.
+		objs = self._list(**self._selectors)
+		if objs.Kind == 'Status':
+			raise KubernetesError({'message': 'listing %s failed' % self._resource})
+		self._store.Replace(objs.Items or [], objs.ResourceVersion)
+		self._synced.set()
+		return objs.ResourceVersion
+
+	def _Apply(self, event_type, obj):
+		if event_type == 'DELETED':
+			self._store.Delete(obj)
+		else:
+			self._store.Update(obj)
+		for handler in self._handlers:
+			try:
+				handler(event_type, obj)
+			except Exception:
+				_log.exception('informer for %s: event handler %r failed', self._resource, handler)
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _ModelList, _CompileModel
 
 class ContainerManifest(object):
 	"""A Class representing the ContainerManifest structure used by the kubernetes API
@@ -34,6 +35,16 @@ class ContainerManifest(object):
 	ContainerManifest.RestartPolicy
 
 	"""
+	__slots__ = ('Version', 'ID', 'UUID', 'Volumes', 'Containers',
+		'RestartPolicy')
+	_FIELDS = (
+		_Value('Version', 'version'),
+		_Value('ID', 'id'),
+		_Value('UUID', 'uuid'),
+		_ModelList('Volumes', 'volumes', 'Volume'),
+		_ModelList('Containers', 'containers', 'Container'),
+		_Model('RestartPolicy', 'restartPolicy', 'RestartPolicy'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ContainerManifest.
 		
@@ -96,61 +107,7 @@ class ContainerManifest(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerManifest instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerManifest instance
-		'''
-		data = {}
-		if self.Version:
-			data['version'] = self.Version
-		if self.ID:
-			data['id'] = self.ID
-		if self.UUID:
-			data['uuid'] = self.UUID
-		if self.Volumes:
-			data['volumes'] = [volume.AsDict() for volume in self.Volumes]
-		if self.Containers:
-			data['containers'] = [container.AsDict() for container in self.Containers]
-		if self.RestartPolicy:
-			data['restartPolicy'] = self.RestartPolicy.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ContainerManifest instance
-		'''
-
-		volumes = None
-		containers = None
-		restartPolicy = None
-
-		if 'volumes' in data and data['volumes']:
-			from kubernetes import Volume
-			volumes = [Volume.NewFromJsonDict(volume) for volume in data['volumes']]
-
-		if 'containers' in data and data['containers']:
-			from kubernetes import Container
-			containers = [Container.NewFromJsonDict(container) for container in data['containers']]
-
-		if 'restartPolicy' in data:
-			from kubernetes import RestartPolicy
-			restartPolicy = RestartPolicy.NewFromJsonDict(data['restartPolicy'])
-
-		return ContainerManifest(Version=data.get('version', None),
-					ID=data.get('id', None),
-					UUID=data.get('uuid', None),
-					Volumes=volumes,
-					Containers=containers,
-					RestartPolicy=restartPolicy)
-
+_CompileModel(ContainerManifest)
 
 from kubernetes import TypeMeta
 class ContainerManifestList(TypeMeta):
@@ -164,6 +121,9 @@ class ContainerManifestList(TypeMeta):
 	ContainerManifestList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'ContainerManifest'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ContainerManifestList.
 		
@@ -208,46 +168,7 @@ class ContainerManifestList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(ContainerManifestList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ContainerManifestList instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ContainerManifestList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [containerManifest.AsDict() for containerManifest in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ContainerManifestList instance
-		'''
-
-		items = None
-
-		if 'items' in data:
-			from kubernetes import ContainerManifest
-			items = [ContainerManifest.NewFromJsonDict(containerManifest) for containerManifest in data['items']]
-
-		return ContainerManifestList(
-			Kind=data.get('kind', None),
-			ID=data.get('id', None),
-			UID=data.get('uid', None),
-			CreationTimestamp=data.get('creationTimestamp', None),
-			SelfLink=data.get('selfLink', None),
-			ResourceVersion=data.get('resourceVersion', None),
-			APIVersion=data.get('apiVersion', None),
-			Namespace=data.get('namespace', None),
-			Annotations=data.get('annotations', None),
-
-			Items=items)
+_CompileModel(ContainerManifestList)
 
 '''Backported from v1beta3 to replace ContainerManifest'''
 
@@ -263,6 +184,12 @@ class PodSpec(object):
 	PodSpec.RestartPolicy
 
 	"""
+	__slots__ = ('Volumes', 'Containers', 'RestartPolicy')
+	_FIELDS = (
+		_ModelList('Volumes', 'volumes', 'Volume'),
+		_ModelList('Containers', 'containers', 'Container'),
+		_Model('RestartPolicy', 'restartPolicy', 'RestartPolicy'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete PodSpec.
 		
@@ -310,52 +237,7 @@ class PodSpec(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.PodSpec instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.PodSpec instance
-		'''
-		data = {}
-		if self.Volumes:
-			data['volumes'] = [volume.AsDict() for volume in self.Volumes]
-		if self.Containers:
-			data['containers'] = [container.AsDict for container in self.Containers]
-		if self.RestartPolicy:
-			data['restartPolicy'] = self.RestartPolicy.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.PodSpec instance
-		'''
-
-		volumes = None
-		containers = None
-		restartPolicy = None
-
-		if 'volumes' in data:
-			from kubernetes import Volume
-			volumes = [Volume.NewFromJsonDict(volume) for volume in data['volumes']]
-
-		if 'containers' in data:
-			from kubernetes import Container
-			containers = [Container.NewFromJsonDict(container) for container in data['containers']]
-
-		if 'restartPolicy' in data:
-			from kubernetes import RestartPolicy
-			restartPolicy = RestartPolicy.NewFromJsonDict(data['restartPolicy'])
-
-		return PodSpec(
-					Volumes=volumes,
-					Containers=containers,
-					RestartPolicy=restartPolicy)
+_CompileModel(PodSpec)
 
 
 class BoundPod(TypeMeta):
@@ -370,6 +252,9 @@ class BoundPod(TypeMeta):
 	BoundPod.Spec
 
 	"""
+	__slots__ = ('Spec',)
+	_FIELDS = (_Model('Spec', 'spec', 'PodSpec'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete BoundPod.
 		
@@ -415,46 +300,7 @@ class BoundPod(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(BoundPod, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.BoundPod instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.BoundPod instance
-		'''
-		data = {}
-		if self.Spec:
-			data['spec'] = self.Spec.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.BoundPod instance
-		'''
-
-		spec = None
-
-		if 'spec' in data:
-			from kubernetes import PodSpec
-			spec = PodSpec.NewFromJsonDict(data['spec'])
-
-		return BoundPod(
-			Kind=data.get('kind', None),
-			ID=data.get('id', None),
-			UID=data.get('uid', None),
-			CreationTimestamp=data.get('creationTimestamp', None),
-			SelfLink=data.get('selfLink', None),
-			ResourceVersion=data.get('resourceVersion', None),
-			APIVersion=data.get('apiVersion', None),
-			Namespace=data.get('namespace', None),
-			Annotations=data.get('annotations', None),
-
-			Spec=spec)
+_CompileModel(BoundPod)
 
 
 class BoundPods(TypeMeta):
@@ -469,6 +315,11 @@ class BoundPods(TypeMeta):
 	boundPods.Items
 
 	"""
+	__slots__ = ('Host', 'Items')
+	_FIELDS = (
+		_Value('Host', 'host'),
+		_ModelList('Items', 'items', 'BoundPod'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete BoundPods.
 		
@@ -518,46 +369,5 @@ class BoundPods(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(BoundPods, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.BoundPods instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.BoundPods instance
-		'''
-		data = {}
-		if self.Host:
-			data['host'] = self.Host
-		if self.Items:
-			data['items'] = [boundPod.AsDict() for boundPod in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.BoundPods instance
-		'''
+_CompileModel(BoundPods)
 
-		items = None
-
-		if 'items' in data:
-			from kubernetes import BoundPod
-			items = [BoundPod.NewFromJsonDict(boundPod) for boundPod in data['items']]
-
-		return BoundPods(
-			Kind=data.get('kind', None),
-			ID=data.get('id', None),
-			UID=data.get('uid', None),
-			CreationTimestamp=data.get('creationTimestamp', None),
-			SelfLink=data.get('selfLink', None),
-			ResourceVersion=data.get('resourceVersion', None),
-			APIVersion=data.get('apiVersion', None),
-			Namespace=data.get('namespace', None),
-			Annotations=data.get('annotations', None),
-
-			Host=data.get('host', None),
-			Items=items)
\ No newline at end of file
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _ModelList, _CompileModel
 
 class NodeResources(object):
 	"""A Class representing the NodeResources structure used by the kubernetes API
@@ -25,6 +26,9 @@ class NodeResources(object):
 	NodeResources.Capacity
 
 	"""
+	__slots__ = ('Capacity',)
+	_FIELDS = (_Value('Capacity', 'capacity'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete NodeResources.
 		
@@ -68,31 +72,7 @@ class NodeResources(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.NodeResources instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.NodeResources instance
-		'''
-		data = {}
-		if self.Capacity:
-			data['capacity'] = self.Capacity
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.NodeResources instance
-		'''
-
-		return NodeResources(
-					Capacity=data.get('capacity', None))
-
+_CompileModel(NodeResources)
 
 from kubernetes import TypeMeta
 class Minion(TypeMeta):
@@ -107,6 +87,11 @@ class Minion(TypeMeta):
 	Minion.Resources
 
 	"""
+	__slots__ = ('HostIP', 'Resources')
+	_FIELDS = (
+		_Value('HostIP', 'hostIP'),
+		_Model('Resources', 'resources', 'NodeResources'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Minion.
 		
@@ -158,49 +143,7 @@ class Minion(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Minion, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Minion instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Minion instance
-		'''
-		data = {}
-		if self.HostIP:
-			data['hostIP'] = self.HostIP
-		if self.Resources:
-			data['resources'] = self.Resources.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Minion instance
-		'''
-
-		resources = None
-
-		if 'resources' in data:
-			from kubernetes import NodeResources
-			resources = NodeResources.NewFromJsonDict(data['resources'])
-
-		return Minion(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					HostIP=data.get('hostIP', None),
-					Resources=resources)
+_CompileModel(Minion)
 
 
 class MinionList(TypeMeta):
@@ -213,6 +156,9 @@ class MinionList(TypeMeta):
 	minionList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'Minion'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete MinionList.
 		
@@ -259,46 +205,16 @@ class MinionList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(MinionList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.MinionList instance.
-
-		The return values uses the same key names as the JSON representation.
+	def AsColumns(self):
+		'''A columnar view of this kubernetes.MinionList instance.
 
 		Returns:
-		  A dict representing this kubernetes.MinionList instance
+		  A kubernetes.MinionColumns instance
 		'''
-		data = {}
-		if self.Items:
-			data['items'] = [minion.AsDict() for minion in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.MinionList instance
-		'''
-
-		items = None
-
-		if 'items' in data:
-			from kubernetes import Minion
-			items = [Minion.NewFromJsonDict(minion) for minion in data['items']]
+		from kubernetes import MinionColumns
+		return MinionColumns.NewFromList(self)
 
-		return MinionList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Items=items)
+_CompileModel(MinionList)
 
 
 class Binding(TypeMeta):
@@ -312,6 +228,11 @@ class Binding(TypeMeta):
 	Binding.Host
 
 	"""
+	__slots__ = ('PostID', 'Host')
+	_FIELDS = (
+		_Value('PostID', 'postID'),
+		_Value('Host', 'host'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Binding.
 		
@@ -361,40 +282,5 @@ class Binding(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Binding, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Binding instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Binding instance
-		'''
-		data = {}
-		if self.PostID:
-			data['postID'] = self.PostID
-		if self.Host:
-			data['host'] = self.Host
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Binding instance
-		'''
+_CompileModel(Binding)
 
-		return Binding(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					PostID=data.get('postID', None),
-					Host=data.get('host', None))
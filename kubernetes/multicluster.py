@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Running the same query against many clusters at once.'''
+
+import Queue
+import threading
+import time
+
+from kubernetes import KubernetesError, AsyncApi
+
+class MultiClusterResult(object):
+	'''The outcome of a query run by kubernetes.MultiClusterApi.
+
+	The MultiClusterResult structure exposes the following properties:
+
+	MultiClusterResult.Results
+
+	  A dict mapping each cluster that answered to its return value.
+
+	MultiClusterResult.Errors
+
+	  A dict mapping each cluster that failed or timed out to its
+	  KubernetesError.
+
+	MultiClusterResult.Timings
+
+	  A dict mapping each cluster that answered to the seconds it took.
+	'''
+	__slots__ = ('Results', 'Errors', 'Timings')
+
+	def __init__(self):
+		self.Results = {}
+		self.Errors = {}
+		self.Timings = {}
+
+	def __iter__(self):
+		return iter(self.GetItems())
+
+	def GetItems(self):
+		'''Return the items of every cluster's list as (cluster, item)
+		tuples, so that each object can be traced back to its cluster.
+		Works for list objects and for the parsed JSON of raw queries.
+		'''
+		items = []
+		for cluster in sorted(self.Results):
+			result = self.Results[cluster]
+			if isinstance(result, dict):
+				cluster_items = result.get('items')
+			else:
+				cluster_items = getattr(result, 'Items', None)
+			items.extend([(cluster, item) for item in cluster_items or ()])
+		return items
+
+	def CheckErrors(self):
+		'''Raise the KubernetesError of the first failed cluster, if any.'''
+		for cluster in sorted(self.Errors):
+			raise self.Errors[cluster]
+
+class MultiClusterApi(object):
+	'''A facade over one kubernetes.Api per cluster.
+
+	Each query is sent to every cluster at the same time, on one thread
+	per cluster, and the answers are collected into a MultiClusterResult.
+	A cluster that has not answered by its timeout is reported as an error
+	and does not hold up the others; its request is left to finish in the
+	background.
+
+	Example:
+	  clusters = kubernetes.MultiClusterApi({
+	    'us': kubernetes.Api(base_url='https://us.example.com/api/v1beta2'),
+	    'eu': kubernetes.Api(base_url='https://eu.example.com/api/v1beta2')},
+	    timeout=5)
+	  for (cluster, pod) in clusters.GetPods(label_selector='name=frontend'):
+	    print cluster, pod.ID
+	'''
+	def __init__(self, clusters=None, timeout=None, timeouts=None):
+		'''Instantiate a new kubernetes.MultiClusterApi object
+
+		Args:
+		  clusters:
+		  	A dict mapping cluster names to kubernetes.Api instances.
+			The Api wrapped by a kubernetes.AsyncApi is used directly,
+			as queries already run on their own threads. [Optional]
+		  timeout:
+		  	Seconds to wait for each cluster to answer a query.  Defaults
+			to waiting as long as the Api instances do. [Optional]
+		  timeouts:
+		  	A dict of cluster names to timeouts overriding timeout for
+			those clusters. [Optional]
+		'''
+		self._lock = threading.Lock()
+		self._clusters = dict([(name, self._GetBlockingApi(api))
+			for (name, api) in (clusters or {}).iteritems()])
+		self._timeout = timeout
+		self._timeouts = dict(timeouts or {})
+
+	def AddCluster(self, name, api, timeout=None):
+		'''Add or replace the cluster called name, optionally with its own timeout.'''
+		with self._lock:
+			self._clusters[name] = self._GetBlockingApi(api)
+			if timeout is not None:
+				self._timeouts[name] = timeout
+
+	def RemoveCluster(self, name):
+		'''Forget the cluster called name and return its kubernetes.Api.'''
+		with self._lock:
+			self._timeouts.pop(name, None)
+			return self._clusters.pop(name, None)
+
+	def GetClusters(self):
+		'''Return the names of the clusters.'''
+		with self._lock:
+			return sorted(self._clusters)
+
+	def GetApi(self, name):
+		'''Return the kubernetes.Api of the cluster called name.'''
+		return self._clusters[name]
+
+	def GetPods(self, **kwargs):
+		'''Run kubernetes.Api.GetPods, with the same arguments, on every cluster.'''
+		return self.Query('GetPods', **kwargs)
+
+	def GetReplicationControllers(self, **kwargs):
+		'''Run kubernetes.Api.GetReplicationControllers on every cluster.'''
+		return self.Query('GetReplicationControllers', **kwargs)
+
+	def GetServices(self, **kwargs):
+		'''Run kubernetes.Api.GetServices on every cluster.'''
+		return self.Query('GetServices', **kwargs)
+
+	def GetMinions(self, **kwargs):
+		'''Run kubernetes.Api.GetMinions on every cluster.'''
+		return self.Query('GetMinions', **kwargs)
+
+	def GetEvents(self, **kwargs):
+		'''Run kubernetes.Api.GetEvents on every cluster.'''
+		return self.Query('GetEvents', **kwargs)
+
+	def Query(self, method, *args, **kwargs):
+		'''Call the kubernetes.Api method called method on every cluster.
+
+		Args:
+		  method:
+		  	The name of a blocking kubernetes.Api method, e.g. 'GetPods'.
+		  *args, **kwargs:
+		  	Passed on to the method.
+
+		Returns:
+		  A kubernetes.MultiClusterResult
+		'''
+		with self._lock:
+			clusters = dict(self._clusters)
+			timeouts = dict([(name, self._timeouts.get(name, self._timeout)) for name in clusters])
+
+		result = MultiClusterResult()
+		answers = Queue.Queue()
+		start = time.time()
+		for (name, api) in clusters.iteritems():
+			thread = threading.Thread(target=self._Call, name='cluster-%s' % name,
+				args=(answers, name, api, method, args, kwargs))
+			thread.daemon = True
+			thread.start()
+
+		deadlines = dict([(name, start + timeout) for (name, timeout) in timeouts.iteritems()
+			if timeout is not None])
+		pending = set(clusters)
+		while pending:
+			waiting = [deadlines[name] for name in pending if name in deadlines]
+			wait = None
+			if waiting:
+				wait = max(0, min(waiting) - time.time())
+			try:
+				(name, value, error, elapsed) = answers.get(timeout=wait)
+			except Queue.Empty:
+				now = time.time()
+				for name in [name for name in pending if deadlines.get(name, now + 1) <= now]:
+					pending.discard(name)
+					result.Errors[name] = KubernetesError({'message':
+						'cluster %s did not answer within %s seconds' % (name, timeouts[name])})
+				continue
+			if name not in pending:
+				continue
+			pending.discard(name)
+			if error is not None:
+				result.Errors[name] = error
+			else:
+				result.Results[name] = value
+				result.Timings[name] = elapsed
+		return result
+
+	def Close(self):
+		'''Close the pooled connections of every cluster.'''
+		for api in self._clusters.values():
+			api.Close()
+
+	@staticmethod
+	def _GetBlockingApi(api):
+		if isinstance(api, AsyncApi):
+			return api.GetApi()
+		return api
+
+	def _Call(self, answers, name, api, method, args, kwargs):
+		start = time.time()
+		try:
+			value = getattr(api, method)(*args, **kwargs)
+		except KubernetesError as e:
+			answers.put((name, None, e, None))
+		except Exception as e:
+			answers.put((name, None, KubernetesError({'message': '%s: %s' % (type(e).__name__, e)}), None))
+		else:
+			answers.put((name, value, None, time.time() - start))
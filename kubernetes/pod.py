@@ -15,11 +15,15 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _ModelList, _ModelMap, _CompileModel
 
 class RestartPolicyAlways(object):
 	"""A Class representing the RestartPolicyAlways structure used by the kubernetes API
 
 	"""
+	__slots__ = ()
+	_FIELDS = ()
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete RestartPolicyAlways.
 		'''
@@ -48,26 +52,8 @@ class RestartPolicyAlways(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.RestartPolicyAlways instance.
+_CompileModel(RestartPolicyAlways)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.RestartPolicyAlways instance
-		'''
-		data = {}
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.RestartPolicyAlways instance
-		'''
-		return RestartPolicyAlways()
 
 class RestartPolicyOnFailure(object):
 	"""A Class representing the RestartPolicyOnFailure structure used by the kubernetes API
@@ -75,6 +61,9 @@ class RestartPolicyOnFailure(object):
 		TODO(dchen1107): Define what kinds of failures should restart.
 		TODO(dchen1107): Decide whether to support policy knobs, and, if so, which ones.
 	"""
+	__slots__ = ()
+	_FIELDS = ()
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete RestartPolicyOnFailure.
 		'''
@@ -103,32 +92,16 @@ class RestartPolicyOnFailure(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.RestartPolicyOnFailure instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.RestartPolicyOnFailure instance
-		'''
-		data = {}
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.RestartPolicyOnFailure instance
-		'''
-		return RestartPolicyOnFailure()
+_CompileModel(RestartPolicyOnFailure)
 
 
 class RestartPolicyNever(object):
 	"""A Class representing the RestartPolicyNever structure used by the kubernetes API
 
 	"""
+	__slots__ = ()
+	_FIELDS = ()
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete RestartPolicyNever.
 		'''
@@ -157,26 +130,7 @@ class RestartPolicyNever(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.RestartPolicyNever instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.RestartPolicyNever instance
-		'''
-		data = {}
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.RestartPolicyNever instance
-		'''
-		return RestartPolicyNever()
+_CompileModel(RestartPolicyNever)
 
 
 class RestartPolicy(object):
@@ -189,6 +143,12 @@ class RestartPolicy(object):
 	RestartPolicy.Never
 
 	"""
+	__slots__ = ('Always', 'OnFailure', 'Never')
+	_FIELDS = (
+		_Model('Always', 'always', 'RestartPolicyAlways'),
+		_Model('OnFailure', 'onFailure', 'RestartPolicyOnFailure'),
+		_Model('Never', 'never', 'RestartPolicyNever'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete RestartPolicy.
 		
@@ -241,52 +201,8 @@ class RestartPolicy(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.RestartPolicy instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.RestartPolicy instance
-		'''
-		data = {}
-		if self.Always:
-			data['always'] = self.Always.AsDict()
-		if self.OnFailure:
-			data['onFailure'] = self.OnFailure.AsDict()
-		if self.Never:
-			data['never'] = self.Never.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.RestartPolicy instance
-		'''
-
-		always = None
-		onFailure = None
-		never = None
-
-		if 'always' in data:
-			from kubernetes import RestartPolicyAlways
-			always = RestartPolicyAlways.NewFromJsonDict(data['always'])
-
-		if 'onFailure' in data:
-			from kubernetes import RestartPolicyOnFailure
-			onFailure = RestartPolicyOnFailure.NewFromJsonDict(data['onFailure'])
+_CompileModel(RestartPolicy)
 
-		if 'never' in data:
-			from kubernetes import RestartPolicyNever
-			never = RestartPolicyNever.NewFromJsonDict(data['never'])
-
-		return RestartPolicy(
-					Always=always,
-					OnFailure=onFailure,
-					Never=never)
 
 class PodState(object):
 	"""A Class representing the PodState structure used by the kubernetes API
@@ -303,6 +219,15 @@ class PodState(object):
 	PodState.Info
 
 	"""
+	__slots__ = ('Manifest', 'Status', 'Host', 'HostIP', 'PodIP', 'Info')
+	_FIELDS = (
+		_Model('Manifest', 'manifest', 'ContainerManifest', lazy=True),
+		_Value('Status', 'status'),
+		_Value('Host', 'host'),
+		_Value('HostIP', 'hostIP'),
+		_Value('PodIP', 'podIP'),
+		_ModelMap('Info', 'info', 'ContainerStatus', lazy=True))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete PodState.
 		
@@ -367,58 +292,7 @@ class PodState(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.PodState instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.PodState instance
-		'''
-
-		data = {}
-		if self.Manifest:
-			data['manifest'] = self.Manifest.AsDict()
-		if self.Status:
-			data['status'] = self.Status
-		if self.Host:
-			data['host'] = self.Host
-		if self.HostIP:
-			data['hostIP'] = self.HostIP
-		if self.PodIP:
-			data['podIP'] = self.PodIP
-		if self.Info:
-			data['info'] = dict([(key, containerStatus.AsDict()) for (key, containerStatus) in self.Info.iteritems()])
-
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.PodState instance
-		'''
-
-		manifest = None
-		info = None
-
-		if 'manifest' in data:
-			from kubernetes import ContainerManifest
-			manifest = ContainerManifest.NewFromJsonDict(data['manifest'])
-
-		if 'info' in data:
-			from kubernetes import ContainerStatus
-			info = dict([(key, ContainerStatus.NewFromJsonDict(cs)) for (key, cs) in data['info'].iteritems()])
-
-		return PodState(
-					Manifest=manifest,
-					Status=data.get('status', None),
-					Host=data.get('host', None),
-					HostIP=data.get('hostIP', None),
-					PodIP=data.get('podIP', None),
-					Info=info)
+_CompileModel(PodState)
 
 
 from kubernetes import TypeMeta
@@ -432,6 +306,9 @@ class PodList(TypeMeta):
 	PodList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'Pod'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete PodList.
 		
@@ -478,46 +355,17 @@ class PodList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(PodList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.PodList instance.
-
-		The return values uses the same key names as the JSON representation.
+	def AsColumns(self):
+		'''A columnar view of this kubernetes.PodList instance.
 
 		Returns:
-		  A dict representing this kubernetes.PodList instance
+		  A kubernetes.PodColumns instance
 		'''
-		data = {}
-		if self.Items:
-			data['items'] = [pod.AsDict() for pod in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.PodList instance
-		'''
-
-		items = None
-
-		if 'items' in data and data['items']:
-			from kubernetes import Pod
-			items = [Pod.NewFromJsonDict(pod) for pod in data['items']]
+		from kubernetes import PodColumns
+		return PodColumns.NewFromList(self)
 
-		return PodList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
+_CompileModel(PodList)
 
-					Items=items)
 
 class Pod(TypeMeta):
 	"""A Class representing the Pod structure used by the kubernetes API
@@ -531,6 +379,12 @@ class Pod(TypeMeta):
 	Pod.CurrentState
 
 	"""
+	__slots__ = ('Labels', 'DesiredState', 'CurrentState')
+	_FIELDS = (
+		_Value('Labels', 'labels'),
+		_Model('DesiredState', 'desiredState', 'PodState', lazy=True),
+		_Model('CurrentState', 'currentState', 'PodState', lazy=True))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Pod.
 		
@@ -581,59 +435,9 @@ class Pod(TypeMeta):
 		Returns:
 		  A JSON string representation of this kubernetes.Pod instance.
 		'''
-		return simplejson.dumps(dict(self.AsDict().items()+super(PodList, self).AsDict().items()), sort_keys=True)
+		return simplejson.dumps(dict(self.AsDict().items()+super(Pod, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Pod instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Pod instance
-		'''
-		data = {}
-		if self.Labels:
-			data['labels'] = self.Labels
-		if self.DesiredState:
-			data['desiredState'] = self.DesiredState.AsDict()
-		if self.CurrentState:
-			data['currentState'] = self.CurrentState.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Pod instance
-		'''
-
-		desiredState = None
-		currentState = None
-
-		if 'desiredState' in data:
-			from kubernetes import PodState
-			desiredState = PodState.NewFromJsonDict(data['desiredState'])
-
-		if 'currentState' in data:
-			from kubernetes import PodState
-			currentState = PodState.NewFromJsonDict(data['currentState'])
-
-		return Pod(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Labels=data.get('labels', None),
-					DesiredState=desiredState,
-					CurrentState=currentState)
+_CompileModel(Pod)
 
 
 class ReplicationControllerState(object):
@@ -648,6 +452,12 @@ class ReplicationControllerState(object):
 	ReplicationControllerState.PodTemplate
 
 	"""
+	__slots__ = ('Replicas', 'ReplicaSelector', 'PodTemplate')
+	_FIELDS = (
+		_Value('Replicas', 'replicas'),
+		_Value('ReplicaSelector', 'replicaSelector'),
+		_Model('PodTemplate', 'podTemplate', 'PodTemplate', lazy=True))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ReplicationControllerState.
 		
@@ -697,41 +507,7 @@ class ReplicationControllerState(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ReplicationControllerState instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ReplicationControllerState instance
-		'''
-		data = {}
-		if self.Replicas:
-			data['replicas'] = self.Replicas
-		if self.ReplicaSelector:
-			data['replicaSelector'] = self.ReplicaSelector
-		if self.PodTemplate:
-			data['podTemplate'] = self.PodTemplate.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ReplicationControllerState instance
-		'''
-
-		podTemplate = None
-		if 'podTemplate' in data:
-			from kubernetes import PodTemplate
-			podTemplate = PodTemplate.NewFromJsonDict(data['podTemplate'])
-
-		return ReplicationControllerState(
-					Replicas=data.get('replicas', None),
-					ReplicaSelector=data.get('replicaSelector', None),
-					PodTemplate=podTemplate)
+_CompileModel(ReplicationControllerState)
 
 
 class ReplicationControllerList(TypeMeta):
@@ -744,6 +520,9 @@ class ReplicationControllerList(TypeMeta):
 	ReplicationControllerList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'ReplicationController'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ReplicationControllerList.
 		
@@ -788,48 +567,9 @@ class ReplicationControllerList(TypeMeta):
 		Returns:
 		  A JSON string representation of this kubernetes.ReplicationControllerList instance.
 		'''
-		return simplejson.dumps(dict(self.AsDict().items()+super(PodList, self).AsDict().items()), sort_keys=True)
-
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ReplicationControllerList instance.
+		return simplejson.dumps(dict(self.AsDict().items()+super(ReplicationControllerList, self).AsDict().items()), sort_keys=True)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ReplicationControllerList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [replicationController.AsDict() for replicationController in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ReplicationControllerList instance
-		'''
-
-		items = None
-
-		if 'items' in data:
-			from kubernetes import ReplicationController
-			items = [ReplicationController.NewFromJsonDict(r) for r in data['items']]
-
-		return ReplicationControllerList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Items=items)
+_CompileModel(ReplicationControllerList)
 
 
 class ReplicationController(TypeMeta):
@@ -844,6 +584,12 @@ class ReplicationController(TypeMeta):
 	ReplicationController.Labels
 
 	"""
+	__slots__ = ('DesiredState', 'CurrentState', 'Labels')
+	_FIELDS = (
+		_Model('DesiredState', 'desiredState', 'ReplicationControllerState', lazy=True),
+		_Model('CurrentState', 'currentState', 'ReplicationControllerState', lazy=True),
+		_Value('Labels', 'labels'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ReplicationController.
 		
@@ -894,50 +640,10 @@ class ReplicationController(TypeMeta):
 		Returns:
 		  A JSON string representation of this kubernetes.ReplicationController instance.
 		'''
-		return simplejson.dumps(dict(self.AsDict().items()+super(PodList, self).AsDict().items()), sort_keys=True)
+		return simplejson.dumps(dict(self.AsDict().items()+super(ReplicationController, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ReplicationController instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ReplicationController instance
-		'''
-		data = {}
-		if self.DesiredState:
-			data['desiredState'] = self.DesiredState.AsDict()
-		if self.CurrentState:
-			data['currentState'] = self.CurrentState.AsDict()
-		if self.Labels:
-			data['labels'] = self.Labels
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ReplicationController instance
-		'''
+_CompileModel(ReplicationController)
 
-		desiredState = None
-		currentState = None
-
-		if 'desiredState' in data:
-			from kubernetes import ReplicationControllerState
-			desiredState = ReplicationControllerState.NewFromJsonDict(data['desiredState'])
-
-		if 'currentState' in data:
-			from kubernetes import ReplicationControllerState
-			currentState = ReplicationControllerState.NewFromJsonDict(data['currentState'])
-
-
-		return ReplicationController(
-					DesiredState=desiredState,
-					CurrentState=currentState,
-					Labels=data.get('labels', None))
 
 class PodTemplate(object):
 	"""A Class representing the PodTemplate structure used by the kubernetes API
@@ -950,6 +656,11 @@ class PodTemplate(object):
 	PodTemplate.Labels
 
 	"""
+	__slots__ = ('DesiredState', 'Labels')
+	_FIELDS = (
+		_Model('DesiredState', 'desiredState', 'PodState', lazy=True),
+		_Value('Labels', 'labels'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete PodTemplate.
 		
@@ -996,35 +707,5 @@ class PodTemplate(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.PodTemplate instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.PodTemplate instance
-		'''
-		data = {}
-		if self.DesiredState:
-			data['desiredState'] = self.DesiredState.AsDict()
-		if self.Labels:
-			data['labels'] = self.Labels
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.PodTemplate instance
-		'''
-
-		desiredState = None
-		if 'desiredState' in data:
-			from kubernetes import PodState
-			desiredState = PodState.NewFromJsonDict(data['desiredState'])
+_CompileModel(PodTemplate)
 
-		return PodTemplate(
-					DesiredState=desiredState,
-					Labels=data.get('labels', None))
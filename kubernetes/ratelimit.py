@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Limiting the rate and concurrency of requests sent to the apiserver.'''
+
+import threading
+import time
+
+from kubernetes import KubernetesError
+
+class RateLimiter(object):
+	'''A token bucket limiting requests per second, combined with a cap on
+	the number of requests in flight.
+
+	The bucket holds up to burst tokens and refills at qps tokens a
+	second; every request takes one and waits for it when the bucket is
+	empty.  Waiting threads reserve their token before sleeping, so they
+	are served in the order they arrived and the requests leave evenly
+	spaced instead of all at once.  Thread-safe; share one limiter between
+	Api instances to limit them together.
+
+	Example:
+	  limiter = kubernetes.RateLimiter(qps=20, burst=40, max_in_flight=8)
+	  api = kubernetes.Api(base_url=..., rate_limiter=limiter)
+	  ...
+	  print limiter.GetStats()['wait_time']
+	'''
+	def __init__(self, qps=None, burst=None, max_in_flight=None):
+		'''Instantiate a new kubernetes.RateLimiter object
+
+		Args:
+		  qps:
+		  	The sustained number of requests allowed per second.  If None
+			the rate is not limited.  Defaults to None. [Optional]
+		  burst:
+		  	The number of requests that may be sent at once after a quiet
+			spell.  Defaults to qps, and at least 1. [Optional]
+		  max_in_flight:
+		  	The most requests awaiting an answer at the same time.  If
+			None their number is not limited.  Defaults to None. [Optional]
+		'''
+		if qps is not None and qps <= 0:
+			raise KubernetesError({'message': 'qps must be positive, got %s' % qps})
+		if max_in_flight is not None and max_in_flight < 1:
+			raise KubernetesError({'message': 'max_in_flight must be positive, got %s' % max_in_flight})
+		self._lock = threading.Lock()
+		self._qps = qps
+		self._burst = max(1.0, float(burst if burst is not None else (qps or 1)))
+		self._tokens = self._burst
+		self._last_refill = time.time()
+		self._max_in_flight = max_in_flight
+		self._slots = threading.Semaphore(max_in_flight) if max_in_flight is not None else None
+		self._in_flight = 0
+		self._requests = 0
+		self._throttled = 0
+		self._wait_time = 0.0
+		self._max_wait = 0.0
+
+	def GetQps(self):
+		'''Return the requests allowed per second, or None.'''
+		return self._qps
+
+	def GetBurst(self):
+		'''Return the size of the token bucket.'''
+		return self._burst
+
+	def GetMaxInFlight(self):
+		'''Return the most requests allowed in flight, or None.'''
+		return self._max_in_flight
+
+	def GetInFlight(self):
+		'''Return the number of requests in flight.'''
+		with self._lock:
+			return self._in_flight
+
+	def GetStats(self):
+		'''Return a dict of the limiter metrics:
+
+		  requests: the requests let through
+		  throttled: those that had to wait
+		  wait_time: the seconds spent waiting, summed over all requests
+		  max_wait: the longest any request waited
+		  in_flight: the requests awaiting an answer right now
+		'''
+		with self._lock:
+			return {
+				'requests': self._requests,
+				'throttled': self._throttled,
+				'wait_time': self._wait_time,
+				'max_wait': self._max_wait,
+				'in_flight': self._in_flight}
+
+	def Acquire(self):
+		'''Block until a request may be sent; every call must be followed by
+		a call to Release once the request is answered.
+
+		Returns:
+		  The seconds spent waiting.
+		'''
+		start = time.time()
+		delay = self._Reserve(start)
+		if delay > 0:
+			time.sleep(delay)
+		if self._slots is not None:
+			self._slots.acquire()
+		waited = time.time() - start
+		with self._lock:
+			self._in_flight += 1
+			self._requests += 1
+			# Ignore the scheduling noise of an uncontended acquire.
+			if waited > 0.001:
+				self._throttled += 1
+				self._wait_time += waited
+				self._max_wait = max(self._max_wait, waited)
+		return waited
+
+	def Release(self):
+		'''Mark a request acquired with Acquire as answered.'''
+		with self._lock:
+			self._in_flight -= 1
+		if self._slots is not None:
+			self._slots.release()
+
+	def _Reserve(self, now):
+		'''Take a token, possibly one not refilled yet, and return how long
+		to wait until it is.
+		'''
+		if self._qps is None:
+			return 0
+		with self._lock:
+			self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._qps)
+			self._last_refill = now
+			self._tokens -= 1
+			if self._tokens >= 0:
+				return 0
+			return -self._tokens / self._qps
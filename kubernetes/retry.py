@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''When and how long to wait before retrying a failed request.'''
+
+import random
+import threading
+import time
+
+import requests
+
+class RetryBudget(object):
+	'''Caps retries to a fraction of the requests made, so that a struggling
+	apiserver is not buried under a storm of retries.
+
+	Every request deposits ratio tokens and every retry takes one; on top
+	of that min_retries_per_second tokens trickle in so that a client
+	sending few requests can still retry.  At most max_tokens are kept.
+	Thread-safe; share one budget between Api instances to cap them
+	together.
+	'''
+	def __init__(self, ratio=0.2, min_retries_per_second=1.0, max_tokens=100.0):
+		self._lock = threading.Lock()
+		self._ratio = ratio
+		self._rate = min_retries_per_second
+		self._max_tokens = max_tokens
+		self._tokens = min(max_tokens, max(1.0, min_retries_per_second))
+		self._last_refill = time.time()
+
+	def Deposit(self):
+		'''Record a request.'''
+		with self._lock:
+			self._Refill()
+			self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+	def Withdraw(self):
+		'''Take the token for one retry; return False if there is none left.'''
+		with self._lock:
+			self._Refill()
+			if self._tokens < 1:
+				return False
+			self._tokens -= 1
+			return True
+
+	def GetTokens(self):
+		'''Return the number of retries currently allowed.'''
+		with self._lock:
+			self._Refill()
+			return self._tokens
+
+	def _Refill(self):
+		now = time.time()
+		self._tokens = min(self._max_tokens, self._tokens + (now - self._last_refill) * self._rate)
+		self._last_refill = now
+
+class RetryPolicy(object):
+	'''Retries idempotent requests that failed to connect, timed out or got
+	a transient error status, with exponential backoff and full jitter.
+
+	Attempt n (counting from 0) waits a random time between 0 and
+	min(max_backoff, backoff * 2 ** n) seconds, or the Retry-After the
+	server asked for if that is longer (still capped at max_backoff).
+	'''
+	def __init__(self,
+				max_attempts=3,
+				backoff=0.1,
+				max_backoff=10.0,
+				verbs=('GET', 'PUT', 'DELETE'),
+				status_codes=(429, 500, 502, 503, 504),
+				budget=None):
+		'''Instantiate a new kubernetes.RetryPolicy object
+
+		Args:
+		  max_attempts:
+		  	The most times a request is sent, the first one included.
+			Defaults to 3. [Optional]
+		  backoff:
+		  	The upper bound, in seconds, of the first wait; it doubles
+			with every retry.  Defaults to 0.1. [Optional]
+		  max_backoff:
+		  	The longest wait in seconds.  Defaults to 10. [Optional]
+		  verbs:
+		  	The HTTP verbs that may be retried.  POST is left out as it
+			is not idempotent. [Optional]
+		  status_codes:
+		  	The response statuses that are retried. [Optional]
+		  budget:
+		  	A kubernetes.RetryBudget; defaults to a new one.  Retries stop
+			while the budget is exhausted. [Optional]
+		'''
+		self._max_attempts = max_attempts
+		self._backoff = backoff
+		self._max_backoff = max_backoff
+		self._verbs = frozenset(verbs)
+		self._status_codes = frozenset(status_codes)
+		self._budget = budget if budget is not None else RetryBudget()
+		self._lock = threading.Lock()
+		self._retries = 0
+		self._exhausted = 0
+
+	def GetBudget(self):
+		'''Return the kubernetes.RetryBudget of this policy.'''
+		return self._budget
+
+	def GetStats(self):
+		'''Return a dict with the number of retries made and of retries
+		given up because the budget was exhausted.
+		'''
+		with self._lock:
+			return {'retries': self._retries, 'budget_exhausted': self._exhausted}
+
+	def RecordRequest(self):
+		'''Record a new request, before its first attempt.'''
+		self._budget.Deposit()
+
+	def ShouldRetry(self, verb, attempt, response=None, error=None):
+		'''Return True if a request should be sent again.
+
+		Args:
+		  verb:
+		  	The HTTP verb of the request.
+		  attempt:
+		  	The number of the attempt that just finished, from 0.
+		  response:
+		  	Its requests.Response, if one was received.
+		  error:
+		  	The requests.RequestException it raised, if any.
+		'''
+		if attempt + 1 >= self._max_attempts or verb not in self._verbs:
+			return False
+		if error is not None:
+			if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+				return False
+		elif response is None or response.status_code not in self._status_codes:
+			return False
+		if not self._budget.Withdraw():
+			with self._lock:
+				self._exhausted += 1
+			return False
+		with self._lock:
+			self._retries += 1
+		return True
+
+	def GetDelay(self, attempt, response=None):
+		'''Return the seconds to wait before the attempt after attempt.'''
+		delay = random.uniform(0, min(self._max_backoff, self._backoff * 2 ** attempt))
+		retry_after = response is not None and response.headers.get('Retry-After')
+		if retry_after:
+			try:
+				delay = max(delay, float(retry_after))
+			except ValueError:
+				pass
+		return min(delay, self._max_backoff)
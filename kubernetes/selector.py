@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Label selectors, compiled once and matched against many label sets.'''
+
+import re
+
+from kubernetes import KubernetesError
+
+_REQUIREMENT = re.compile(r'''\s*(?P<not>!)?\s*(?P<key>[A-Za-z0-9_./-]+)\s*
+	(?: (?P<op>==|=|!=)\s*(?P<value>[A-Za-z0-9_.-]*)
+	  | \s(?P<set_op>in|notin)\s*\((?P<values>[^)]*)\)
+	)?\s*(?:,|$)''', re.VERBOSE)
+
+# Operators whose matches can be looked up in a label index.
+_INDEXED = ('=', 'in')
+
+class LabelSelector(object):
+	'''A parsed label selector such as "name=frontend,tier!=cache".
+
+	Requirements are joined by commas and all have to hold:
+	  key=value, key==value  the label key is set to value
+	  key!=value             the label key is missing or set to another value
+	  key in (a,b)           the label key is set to a or b
+	  key notin (a,b)        the label key is missing or set to neither
+	  key                    the label key is set
+	  !key                   the label key is missing
+
+	The requirements are compiled into a single Python expression when the
+	selector is created, so Matches does no parsing or dispatching.
+	'''
+	def __init__(self, requirements=None):
+		'''Instantiate a new kubernetes.LabelSelector object
+
+		Args:
+		  requirements:
+		  	A list of (key, operator, values) tuples, operator being one
+			of '=', '!=', 'in', 'notin', 'exists' or '!' and values a
+			tuple of strings.  Use Parse or NewFromDict instead. [Optional]
+		'''
+		self._requirements = list(requirements or [])
+		self.Matches = self._Compile()
+
+	@staticmethod
+	def Parse(selector):
+		'''Parse a selector string; raises KubernetesError if it is invalid.'''
+		requirements = []
+		pos = 0
+		selector = selector.strip()
+		while pos < len(selector):
+			m = _REQUIREMENT.match(selector, pos)
+			if m is None or m.end() == pos:
+				raise KubernetesError({'message': 'invalid label selector [%s]' % selector})
+			key = m.group('key')
+			if m.group('not'):
+				if m.group('op') or m.group('set_op'):
+					raise KubernetesError({'message': 'invalid label selector [%s]' % selector})
+				requirements.append((key, '!', ()))
+			elif m.group('op'):
+				op = '!=' if m.group('op') == '!=' else '='
+				requirements.append((key, op, (m.group('value'),)))
+			elif m.group('set_op'):
+				values = tuple([value.strip() for value in m.group('values').split(',') if value.strip()])
+				requirements.append((key, m.group('set_op'), values))
+			else:
+				requirements.append((key, 'exists', ()))
+			pos = m.end()
+		return LabelSelector(requirements)
+
+	@staticmethod
+	def NewFromDict(labels):
+		'''Return a selector requiring every key=value pair of labels, as in
+		Service.Selector and ReplicationControllerState.ReplicaSelector.
+		'''
+		return LabelSelector([(key, '=', (value,)) for (key, value) in sorted((labels or {}).iteritems())])
+
+	@staticmethod
+	def NewFrom(selector):
+		'''Return selector as a LabelSelector; it may already be one, or be a
+		selector string, a dict of labels or None (matching everything).
+		'''
+		if isinstance(selector, LabelSelector):
+			return selector
+		if isinstance(selector, basestring):
+			return LabelSelector.Parse(selector)
+		return LabelSelector.NewFromDict(selector)
+
+	def __str__(self):
+		parts = []
+		for (key, op, values) in self._requirements:
+			if op in ('=', '!='):
+				parts.append('%s%s%s' % (key, op, values[0]))
+			elif op in ('in', 'notin'):
+				parts.append('%s %s (%s)' % (key, op, ','.join(values)))
+			elif op == 'exists':
+				parts.append(key)
+			else:
+				parts.append('!%s' % key)
+		return ','.join(parts)
+
+	def __repr__(self):
+		return 'LabelSelector(%r)' % str(self)
+
+	def __eq__(self, other):
+		return isinstance(other, LabelSelector) and self._requirements == other._requirements
+
+	def __ne__(self, other):
+		return not self.__eq__(other)
+
+	def Empty(self):
+		'''Return True if the selector matches every label set.'''
+		return not self._requirements
+
+	def GetRequirements(self):
+		'''Return the (key, operator, values) tuples of the selector.'''
+		return list(self._requirements)
+
+	def _Compile(self):
+		namespace = {}
+		terms = []
+		for (i, (key, op, values)) in enumerate(self._requirements):
+			namespace['k%d' % i] = key
+			if op == '=':
+				namespace['v%d' % i] = values[0]
+				terms.append('get(k%d) == v%d' % (i, i))
+			elif op == '!=':
+				namespace['v%d' % i] = values[0]
+				terms.append('get(k%d) != v%d' % (i, i))
+			elif op == 'in':
+				namespace['v%d' % i] = frozenset(values)
+				terms.append('get(k%d) in v%d' % (i, i))
+			elif op == 'notin':
+				namespace['v%d' % i] = frozenset(values)
+				terms.append('get(k%d) not in v%d' % (i, i))
+			elif op == 'exists':
+				terms.append('k%d in labels' % i)
+			else:
+				terms.append('k%d not in labels' % i)
+		source = '\n'.join([
+			'def Matches(labels):',
+			'\t"""Return True if the labels dict satisfies every requirement."""',
+			'\tif labels is None:',
+			'\t\tlabels = {}',
+			'\tget = labels.get',
+			'\treturn %s' % (' and '.join(terms) or 'True')])
+		exec compile(source, '<selector %s>' % self, 'exec') in namespace
+		return namespace['Matches']
+
+	def _Candidates(self, lookup):
+		'''Narrow down the keys that can match using an inverted label index.
+
+		Args:
+		  lookup:
+		  	lookup(key, value) returns the set of object keys labelled
+			key=value.
+
+		Returns:
+		  A set of candidate keys, which are all matches if the selector
+		  only has '=' and 'in' requirements, or None if the index cannot
+		  narrow the search.
+		'''
+		sets = []
+		for (key, op, values) in self._requirements:
+			if op == '=':
+				sets.append(lookup(key, values[0]) or set())
+			elif op == 'in':
+				union = set()
+				for value in values:
+					union.update(lookup(key, value) or ())
+				sets.append(union)
+		if not sets:
+			return None
+		sets.sort(key=len)
+		return sets[0].intersection(*sets[1:])
+
+	def _IsIndexed(self):
+		return all([op in _INDEXED for (key, op, values) in self._requirements])
+
+class LabelIndex(object):
+	'''An inverted index of label sets for evaluating many selectors.
+
+	Each entry is a key, such as an object ID, with its labels.  Select
+	only looks at the entries listed under the '=' and 'in' requirements
+	of a selector, so its cost follows the size of the answer rather than
+	the number of entries.  Not thread-safe.
+	'''
+	def __init__(self):
+		self._labels = {}
+		self._index = {}
+
+	def __len__(self):
+		return len(self._labels)
+
+	def Add(self, key, labels):
+		'''Add or replace the entry key with the labels dict labels.'''
+		self.Remove(key)
+		labels = dict(labels or {})
+		self._labels[key] = labels
+		for item in labels.iteritems():
+			self._index.setdefault(item, set()).add(key)
+
+	def Remove(self, key):
+		'''Remove the entry key, if present.'''
+		labels = self._labels.pop(key, None)
+		if labels is None:
+			return
+		for item in labels.iteritems():
+			keys = self._index[item]
+			keys.discard(key)
+			if not keys:
+				del self._index[item]
+
+	def Select(self, selector):
+		'''Return the set of keys whose labels match selector, which may be
+		anything accepted by LabelSelector.NewFrom.
+		'''
+		selector = LabelSelector.NewFrom(selector)
+		candidates = selector._Candidates(lambda key, value: self._index.get((key, value)))
+		if candidates is None:
+			candidates = self._labels.iterkeys()
+		elif selector._IsIndexed():
+			return candidates
+		matches = selector.Matches
+		labels = self._labels
+		return set([key for key in candidates if matches(labels[key])])
+
+	def SelectAll(self, selectors):
+		'''Evaluate a dict of name -> selector; return name -> set of keys.'''
+		return dict([(name, self.Select(selector)) for (name, selector) in selectors.iteritems()])
+
+def GroupBySelector(selectors, objs):
+	'''Map each of many selectors to the objects it matches.
+
+	Args:
+	  selectors:
+	  	A dict of names to selectors, e.g. service IDs to Service.Selector.
+	  objs:
+	  	Objects with a Labels attribute, such as kubernetes.Pod instances.
+
+	Returns:
+	  A dict mapping each name to the list of matching objects.
+	'''
+	index = LabelIndex()
+	for (i, obj) in enumerate(objs):
+		index.Add(i, obj.Labels)
+	return dict([(name, [objs[i] for i in sorted(keys)])
+		for (name, keys) in index.SelectAll(selectors).iteritems()])
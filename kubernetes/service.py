@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _ValueList, _ModelList, _CompileModel
 
 from kubernetes import TypeMeta
 class ServiceList(TypeMeta):
@@ -27,6 +28,9 @@ class ServiceList(TypeMeta):
 	ServiceList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'Service'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete ServiceList.
 		
@@ -73,46 +77,8 @@ class ServiceList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(ServiceList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.ServiceList instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.ServiceList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [service.AsDict() for service in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.ServiceList instance
-		'''
-
-		items = None
-
-		if 'items' in data and data['items']:
-			from kubernetes import Service
-			items = [Service.NewFromJsonDict(service) for service in data['items']]
+_CompileModel(ServiceList)
 
-		return ServiceList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Items=items)
 
 class Service(TypeMeta):
 	"""A Class representing the Service structure used by the kubernetes API
@@ -133,6 +99,18 @@ class Service(TypeMeta):
 	Service.ProxyPort
 
 	"""
+	__slots__ = ('Port', 'Protocol', 'Labels', 'Selector',
+		'CreateExternalLoadBalancer', 'ContainerPort', 'PortalIP', 'ProxyPort')
+	_FIELDS = (
+		_Value('Port', 'port'),
+		_Value('Protocol', 'protocol'),
+		_Value('Labels', 'labels'),
+		_Value('Selector', 'selector'),
+		_Value('CreateExternalLoadBalancer', 'createExternalLoadBalancer'),
+		_Value('ContainerPort', 'containerPort'),
+		_Value('PortalIP', 'portalIP'),
+		_Value('ProxyPort', 'proxyPort'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Service.
 		
@@ -208,61 +186,7 @@ class Service(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Service, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Service instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Service instance
-		'''
-		data = {}
-		if self.Port:
-			data['port'] = self.Port
-		if self.Protocol:
-			data['protocol'] = self.Protocol
-		if self.Labels:
-			data['labels'] = self.Labels
-		if self.Selector:
-			data['selector'] = self.Selector
-		if self.CreateExternalLoadBalancer:
-			data['createExternalLoadBalancer'] = self.CreateExternalLoadBalancer
-		if self.ContainerPort:
-			data['containerPort'] = self.ContainerPort
-		if self.PortalIP:
-			data['portalIP'] = self.PortalIP
-		if self.ProxyPort:
-			data['proxyPort'] = self.ProxyPort
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Service instance
-		'''
-
-		return Service(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Port=data.get('port', None),
-					Protocol=data.get('protocol', None),
-					Labels=data.get('labels', None),
-					Selector=data.get('selector', None),
-					CreateExternalLoadBalancer=data.get('createExternalLoadBalancer', None),
-					ContainerPort=data.get('containerPort', None),
-					PortalIP=data.get('portalIP', None),
-					ProxyPort=data.get('proxyPort', None))
+_CompileModel(Service)
 
 
 class Endpoints(TypeMeta):
@@ -276,6 +200,9 @@ class Endpoints(TypeMeta):
 	Endpoints.Endpoints
 
 	"""
+	__slots__ = ('Endpoints',)
+	_FIELDS = (_ValueList('Endpoints', 'endpoints'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Endpoints.
 		
@@ -322,40 +249,8 @@ class Endpoints(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Endpoints, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Endpoints instance.
+_CompileModel(Endpoints)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Endpoints instance
-		'''
-		data = {}
-		if self.Endpoints:
-			data['endpoints'] = [endpoint.AsDict() for endpoint in self.Endpoints]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Endpoints instance
-		'''
-
-		return Endpoints(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Endpoints=data.get('endpoints', None))
 
 class EndpointsList(TypeMeta):
 	"""A Class representing the EndpointsList structure used by the kubernetes API
@@ -367,6 +262,9 @@ class EndpointsList(TypeMeta):
 	EndpointsList.Items
 
 	"""
+	__slots__ = ('Items',)
+	_FIELDS = (_ModelList('Items', 'items', 'Endpoints'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete EndpointsList.
 		
@@ -413,43 +311,5 @@ class EndpointsList(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(EndpointsList, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.EndpointsList instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.EndpointsList instance
-		'''
-		data = {}
-		if self.Items:
-			data['items'] = [endPoints.AsDict() for endPoints in self.Items]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.EndpointsList instance
-		'''
-
-		items = None
-
-		if 'items' in data:
-			from kubernetes import Endpoints
-			items = [Endpoints.NewFromJsonDict(endpoint) for endpoint in data['items']]
-
-		return EndpointsList(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
+_CompileModel(EndpointsList)
 
-					Items=items)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''The state of a whole cluster, fetched with concurrent list calls.'''
+
+# The resources of a snapshot, with the Api list method and the
+# ClusterSnapshot attribute of each.
+RESOURCES = [
+	('pods', 'GetPods', 'Pods'),
+	('services', 'GetServices', 'Services'),
+	('replicationControllers', 'GetReplicationControllers', 'ReplicationControllers'),
+	('minions', 'GetMinions', 'Minions'),
+	('events', 'GetEvents', 'Events')]
+
+# Resources that do not belong to a namespace and are fetched only once.
+CLUSTER_RESOURCES = ('minions',)
+
+class ClusterSnapshot(object):
+	'''A kubernetes.ClusterSnapshot, as returned by kubernetes.Api.GetSnapshot.
+
+	The ClusterSnapshot structure exposes the following properties:
+
+	ClusterSnapshot.Pods
+	ClusterSnapshot.Services
+	ClusterSnapshot.ReplicationControllers
+	ClusterSnapshot.Minions
+	ClusterSnapshot.Events
+
+	  The list object of each resource, or None if it was not requested.
+	  When several namespaces were requested their items are merged.
+
+	ClusterSnapshot.Timings
+
+	  A dict mapping (resource, namespace) to the seconds its request took.
+
+	ClusterSnapshot.ResourceVersions
+
+	  A dict mapping (resource, namespace) to the resourceVersion listed.
+
+	ClusterSnapshot.Elapsed
+
+	  The wall clock seconds taken by the whole snapshot.
+	'''
+	__slots__ = ('Pods', 'Services', 'ReplicationControllers', 'Minions', 'Events',
+		'Timings', 'ResourceVersions', 'Elapsed')
+
+	def __init__(self):
+		self.Pods = None
+		self.Services = None
+		self.ReplicationControllers = None
+		self.Minions = None
+		self.Events = None
+		self.Timings = {}
+		self.ResourceVersions = {}
+		self.Elapsed = None
+
+	def GetTotalRequestTime(self):
+		'''Return the sum of the request times; compared with Elapsed this
+		shows how much the concurrent requests overlapped.
+		'''
+		return sum(self.Timings.values())
+
+	def _Add(self, resource, namespace, items, elapsed):
+		attribute = dict([(name, attr) for (name, method, attr) in RESOURCES])[resource]
+		self.Timings[(resource, namespace)] = elapsed
+		self.ResourceVersions[(resource, namespace)] = items.ResourceVersion
+		merged = getattr(self, attribute)
+		if merged is None:
+			setattr(self, attribute, items)
+		else:
+			# The lists may be shared with the object cache, so never change
+			# them; a merged list has no single resourceVersion.
+			setattr(self, attribute, type(items)(
+				Kind=merged.Kind,
+				APIVersion=merged.APIVersion,
+				Items=(merged.Items or []) + (items.Items or [])))
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _ModelList, _CompileModel
 
 from kubernetes import TypeMeta
 class Status(TypeMeta):
@@ -33,6 +34,14 @@ class Status(TypeMeta):
 	Status.Code
 
 	"""
+	__slots__ = ('Status', 'Message', 'Reason', 'Details', 'Code')
+	_FIELDS = (
+		_Value('Status', 'status'),
+		_Value('Message', 'message'),
+		_Value('Reason', 'reason'),
+		_Model('Details', 'details', 'StatusDetails'),
+		_Value('Code', 'code'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Status.
 		
@@ -102,58 +111,7 @@ class Status(TypeMeta):
 		'''
 		return simplejson.dumps(dict(self.AsDict().items()+super(Status, self).AsDict().items()), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Status instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Status instance
-		'''
-		data = {}
-		if self.Status:
-			data['status'] = self.Status
-		if self.Message:
-			data['message'] = self.Message
-		if self.Reason:
-			data['reason'] = self.Reason
-		if self.Details:
-			data['details'] = self.Details.AsDict()
-		if self.Code:
-			data['code'] = self.Code
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Status instance
-		'''
-
-		details = None
-
-		if 'details' in data:
-			from kubernetes import StatusDetails
-			details = StatusDetails.NewFromJsonDict(data['details'])
-
-		return Status(
-					Kind=data.get('kind', None),
-					ID=data.get('id', None),
-					UID=data.get('uid', None),
-					CreationTimestamp=data.get('creationTimestamp', None),
-					SelfLink=data.get('selfLink', None),
-					ResourceVersion=data.get('resourceVersion', None),
-					APIVersion=data.get('apiVersion', None),
-					Namespace=data.get('namespace', None),
-					Annotations=data.get('annotations', None),
-
-					Status=data.get('status', None),
-					Message=data.get('message', None),
-					Reason=data.get('reason', None),
-					Details=details,
-					Code=data.get('code', None))
+_CompileModel(Status)
 
 
 class StatusDetails(object):
@@ -173,6 +131,12 @@ class StatusDetails(object):
 	StatusDetails.Causes
 
 	"""
+	__slots__ = ('ID', 'Kind', 'Causes')
+	_FIELDS = (
+		_Value('ID', 'id'),
+		_Value('Kind', 'kind'),
+		_ModelList('Causes', 'causes', 'StatusCause'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete StatusDetails.
 		
@@ -226,42 +190,8 @@ class StatusDetails(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.StatusDetails instance.
+_CompileModel(StatusDetails)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.StatusDetails instance
-		'''
-		data = {}
-		if self.ID:
-			data['id'] = self.ID
-		if self.Kind:
-			data['kind'] = self.Kind
-		if self.Causes:
-			data['causes'] = [cause.AsDict() for cause in self.Causes]
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.StatusDetails instance
-		'''
-
-		causes = None
-
-		if 'causes' in data:
-			from kubernetes import StatusCause
-			causes = [StatusCause.NewFromJsonDict(cause) for cause in data['causes']]
-
-		return StatusDetails(
-					ID=data.get('id', None),
-					Kind=data.get('kind', None),
-					Causes=causes)
 
 class StatusReason(object):
 	"""
@@ -351,6 +281,12 @@ class StatusCause(object):
 	StatusCause.Field
 
 	"""
+	__slots__ = ('Type', 'Message', 'Field')
+	_FIELDS = (
+		_Value('Type', 'reason'),
+		_Value('Message', 'message'),
+		_Value('Field', 'field'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete StatusCause.
 		
@@ -411,35 +347,8 @@ class StatusCause(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.StatusCause instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.StatusCause instance
-		'''
-		data = {}
-		if self.Type:
-			data['reason'] = self.Type
-		if self.Message:
-			data['message'] = self.Message
-		if self.Field:
-			data['field'] = self.Field
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.StatusCause instance
-		'''
+_CompileModel(StatusCause)
 
-		return StatusCause(Type=data.get('reason', None),
-					Message=data.get('message', None),
-					Field=data.get('field', None))
 
 class CauseType(object):
 	"""CauseType is a machine readable value providing more detail about what
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+#
+# Copyright 2014 tigmi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''A thread-safe in-memory copy of cluster objects.'''
+
+import threading
+
+from kubernetes import KubernetesError, LabelSelector
+
+def IndexByNamespace(obj):
+	'''Index values of an object: its namespace.'''
+	return [obj.Namespace] if obj.Namespace else []
+
+def IndexByLabel(obj):
+	'''Index values of an object: one "<key>=<value>" string per label.'''
+	return ['%s=%s' % (key, value) for (key, value) in (obj.Labels or {}).iteritems()]
+
+def IndexByHost(pod):
+	'''Index values of a kubernetes.Pod: the host it runs on.'''
+	state = pod.CurrentState
+	return [state.Host] if state is not None and state.Host else []
+
+def IndexByStatus(pod):
+	'''Index values of a kubernetes.Pod: its current status.'''
+	state = pod.CurrentState
+	return [state.Status] if state is not None and state.Status else []
+
+class Store(object):
+	'''A thread-safe map of model objects, such as kubernetes.Pod, keyed by
+	namespace and ID.
+
+	A kubernetes.Informer keeps a Store in sync with the cluster; readers
+	on other threads look objects up without talking to the apiserver.
+
+	Indexers map an object to a list of index values.  Every index is
+	updated along with the objects, so ByIndex costs time in proportion
+	to the number of objects returned rather than to the size of the
+	store.
+	'''
+	def __init__(self, indexers=None):
+		'''Instantiate a new kubernetes.Store object
+
+		Args:
+		  indexers:
+		  	A dict of index names to functions returning the index values
+			of an object, such as kubernetes.store.IndexByLabel. [Optional]
+		'''
+		self._lock = threading.RLock()
+		self._objects = {}
+		self._resource_version = None
+		self._indexers = {}
+		# index name -> index value -> set of keys
+		self._indices = {}
+		# index name -> key -> the index values the key was filed under
+		self._index_values = {}
+		for (name, indexer) in (indexers or {}).iteritems():
+			self.AddIndexer(name, indexer)
+
+	@staticmethod
+	def GetKey(obj):
+		'''Return the key obj is stored under: "<namespace>/<id>", or just
+		the ID of objects without a namespace.
+		'''
+		if obj.Namespace:
+			return '%s/%s' % (obj.Namespace, obj.ID)
+		return obj.ID
+
+	def __len__(self):
+		return len(self._objects)
+
+	def __contains__(self, key):
+		return key in self._objects
+
+	def Get(self, key):
+		'''Return the object stored under key, or None.'''
+		return self._objects.get(key)
+
+	def List(self):
+		'''Return a list of all stored objects.'''
+		with self._lock:
+			return self._objects.values()
+
+	def ListKeys(self):
+		'''Return a list of the keys of all stored objects.'''
+		with self._lock:
+			return self._objects.keys()
+
+	def GetResourceVersion(self):
+		'''Return the resourceVersion the store was last brought up to.'''
+		return self._resource_version
+
+	def AddIndexer(self, name, indexer):
+		'''Add an index called name, computed with indexer(obj), over the
+		objects already stored and all those added later.
+		'''
+		with self._lock:
+			self._indexers[name] = indexer
+			self._indices[name] = {}
+			self._index_values[name] = {}
+			for (key, obj) in self._objects.iteritems():
+				self._IndexObject(name, key, obj)
+
+	def ByIndex(self, name, value):
+		'''Return the objects filed under value in the index called name.'''
+		with self._lock:
+			return [self._objects[key] for key in self._GetIndex(name).get(value, ())]
+
+	def IndexKeys(self, name, value):
+		'''Return the keys filed under value in the index called name.'''
+		with self._lock:
+			return list(self._GetIndex(name).get(value, ()))
+
+	def ListIndexValues(self, name):
+		'''Return the values present in the index called name.'''
+		with self._lock:
+			return self._GetIndex(name).keys()
+
+	def Add(self, obj):
+		'''Store obj, replacing any object with the same key.'''
+		self.Update(obj)
+
+	def Update(self, obj):
+		'''Store obj, replacing any object with the same key.'''
+		key = self.GetKey(obj)
+		with self._lock:
+			self._UnindexKey(key)
+			self._objects[key] = obj
+			for name in self._indexers:
+				self._IndexObject(name, key, obj)
+			self._SetResourceVersion(obj.ResourceVersion)
+
+	def Delete(self, obj):
+		'''Remove the object with the key of obj, if any.'''
+		key = self.GetKey(obj)
+		with self._lock:
+			self._UnindexKey(key)
+			self._objects.pop(key, None)
+			self._SetResourceVersion(obj.ResourceVersion)
+
+	def Replace(self, objs, resource_version=None):
+		'''Replace the whole content of the store, e.g. after a new list.'''
+		objects = dict([(self.GetKey(obj), obj) for obj in objs])
+		with self._lock:
+			self._objects = objects
+			self._resource_version = resource_version
+			for name in self._indexers:
+				self._indices[name] = {}
+				self._index_values[name] = {}
+				for (key, obj) in objects.iteritems():
+					self._IndexObject(name, key, obj)
+
+	def _GetIndex(self, name):
+		try:
+			return self._indices[name]
+		except KeyError:
+			raise KubernetesError({'message': 'no index named %s' % name})
+
+	def _IndexObject(self, name, key, obj):
+		values = self._indexers[name](obj)
+		if not values:
+			return
+		index = self._indices[name]
+		for value in values:
+			index.setdefault(value, set()).add(key)
+		self._index_values[name][key] = values
+
+	def _UnindexKey(self, key):
+		for name in self._indexers:
+			values = self._index_values[name].pop(key, ())
+			index = self._indices[name]
+			for value in values:
+				keys = index.get(value)
+				if keys is not None:
+					keys.discard(key)
+					if not keys:
+						del index[value]
+
+	def _SetResourceVersion(self, resource_version):
+		if resource_version is not None:
+			self._resource_version = resource_version
+
+class PodStore(Store):
+	'''A kubernetes.Store of kubernetes.Pod objects indexed by namespace,
+	host, label and status.
+	'''
+	INDEXERS = {
+		'namespace': IndexByNamespace,
+		'host': IndexByHost,
+		'label': IndexByLabel,
+		'status': IndexByStatus}
+
+	def __init__(self, indexers=None):
+		'''Instantiate a new kubernetes.PodStore object
+
+		Args:
+		  indexers:
+		  	Extra indexers, in addition to INDEXERS. [Optional]
+		'''
+		all_indexers = dict(self.INDEXERS)
+		all_indexers.update(indexers or {})
+		super(PodStore, self).__init__(all_indexers)
+
+	def ListByNamespace(self, namespace):
+		'''Return the pods in namespace.'''
+		return self.ByIndex('namespace', namespace)
+
+	def ListByHost(self, host):
+		'''Return the pods running on the minion called host.'''
+		return self.ByIndex('host', host)
+
+	def ListByStatus(self, status):
+		'''Return the pods whose current status is status, such as
+		kubernetes.PodStatus.PodRunning.
+		'''
+		return self.ByIndex('status', status)
+
+	def ListByLabel(self, key, value):
+		'''Return the pods labelled key=value.'''
+		return self.ByIndex('label', '%s=%s' % (key, value))
+
+	def ListBySelector(self, selector):
+		'''Return the pods matching selector, which may be a
+		kubernetes.LabelSelector, a selector string, or a dict of labels
+		such as Service.Selector or ReplicationControllerState.ReplicaSelector.
+
+		The label index entries of the '=' and 'in' requirements are
+		intersected, starting from the smallest one, and only the pods left
+		are matched against the other requirements.  An empty selector
+		matches every pod.
+		'''
+		selector = LabelSelector.NewFrom(selector)
+		with self._lock:
+			index = self._indices['label']
+			keys = selector._Candidates(lambda key, value: index.get('%s=%s' % (key, value)))
+			if keys is None:
+				pods = self._objects.values()
+			else:
+				pods = [self._objects[key] for key in keys]
+				if selector._IsIndexed():
+					return pods
+		return [pod for pod in pods if selector.Matches(pod.Labels)]
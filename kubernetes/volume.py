@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from kubernetes import simplejson
+from kubernetes._schema import _Value, _Model, _CompileModel
 
 class Volume(object):
 	'''A Class representing the Volume structure used by the kubernetes API
@@ -27,6 +28,11 @@ class Volume(object):
 	Volume.Source
 
 	'''
+	__slots__ = ('Name', 'Source')
+	_FIELDS = (
+		_Value('Name', 'name'),
+		_Model('Source', 'source', 'VolumeSource'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes Volume.
 
@@ -79,39 +85,7 @@ class Volume(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Volume instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Volume instance
-		'''
-		data = {}
-		if self.Name:
-			data['name'] = self.Name
-		if self.source:
-			data['source'] = self.Source.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.Volume instance
-		'''
-
-		if 'source' in data:
-			from kubernetes import VolumeSource
-			source = VolumeSource.NewFromJsonDict(data['source'])
-		else:
-			source = None
-		return Volume(Name=data.get('name', None),
-			Source=source)
+_CompileModel(Volume)
 
 
 class VolumeSource(object):
@@ -126,6 +100,12 @@ class VolumeSource(object):
 	VolumeSource.PersistentDisk
 
 	'''
+	__slots__ = ('HostDir', 'EmptyDir', 'PersistentDisk')
+	_FIELDS = (
+		_Model('HostDir', 'hostDir', 'HostDir'),
+		_Model('EmptyDir', 'emptyDir', 'EmptyDir'),
+		_Model('PersistentDisk', 'persistentDisk', 'GCEPersistentDisk'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernetes VolumeSource.
 
@@ -185,56 +165,7 @@ class VolumeSource(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.VolumeSource instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.VolumeSource instance
-		'''
-		data = {}
-		if self.HostDir:
-			data['hostDir'] = self.HostDir.AsDict()
-		if self.EmptyDir:
-			data['emptyDir'] = self.EmptyDir.AsDict()
-		if self.PersistentDisk:
-			data['persistentDisk'] = self.PersistentDisk.AsDict()
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-
-		Returns:
-		  A kubernetes.VolumeSource instance
-		'''
-
-		if 'hostDir' in data:
-			from kubernetes import HostDir
-			hostDir = HostDir.NewFromJsonDict(data['hostDir'])
-		else:
-			hostDir = None
-
-		if 'emptyDir' in data:
-			from kubernetes import EmptyDir
-			emptyDir = EmptyDir.NewFromJsonDict(data['emptyDir'])
-		else:
-			emptyDir = None
-
-		if 'persistentDisk' in data:
-			from kubernetes import PersistentDisk
-			persistentDisk = PersistentDisk.NewFromJsonDict(data['persistentDisk'])
-		else:
-			persistentDisk = None
-
-		return VolumeSource(
-			HostDir=hostDir,
-			EmptyDir=emptyDir,
-			PersistentDisk=persistentDisk)
+_CompileModel(VolumeSource)
 
 
 class HostDir(object):
@@ -247,6 +178,9 @@ class HostDir(object):
 	Hostdir.Path
 
 	"""
+	__slots__ = ('Path',)
+	_FIELDS = (_Value('Path', 'path'),)
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete HostDir.
 		
@@ -289,34 +223,16 @@ class HostDir(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.HostDir instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.HostDir instance
-		'''
-		data = {}
-		if self.Path:
-			data['path'] = self.Path
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.HostDir instance
-		'''
-		return HostDir(Path=data.get('path', None))
+_CompileModel(HostDir)
 
 
 class EmptyDir(object):
 	"""A Class representing the EmptyDir structure used by the kubernetes API
 
 	"""
+	__slots__ = ()
+	_FIELDS = ()
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete EmptyDir.
 		'''
@@ -345,26 +261,8 @@ class EmptyDir(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.EmptyDir instance.
-
-		The return values uses the same key names as the JSON representation.
+_CompileModel(EmptyDir)
 
-		Returns:
-		  A dict representing this kubernetes.EmptyDir instance
-		'''
-		data = {}
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.EmptyDir instance
-		'''
-		return EmptyDir()
 
 class Protocol(object):
 	'''Protocol defines network protocols supported for things like conatiner ports.
@@ -390,6 +288,14 @@ class Port(object):
 	Port.HostIP
 
 	"""
+	__slots__ = ('Name', 'HostPort', 'ContainerPort', 'Protocol', 'HostIP')
+	_FIELDS = (
+		_Value('Name', 'name'),
+		_Value('HostPort', 'hostPort'),
+		_Value('ContainerPort', 'containerPort'),
+		_Value('Protocol', 'protocol', Protocol.ProtocolTCP),
+		_Value('HostIP', 'hostIP'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete Port.
 		
@@ -449,40 +355,8 @@ class Port(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.Port instance.
+_CompileModel(Port)
 
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.Port instance
-		'''
-		data = {}
-		if self.Name:
-			data['name'] = self.Name
-		if self.HostPort:
-			data['hostPort'] = self.HostPort
-		if self.ContainerPort:
-			data['containerPort'] = self.ContainerPort
-		if self.Protocol:
-			data['protocol'] = self.Protocol
-		if self.HostIP:
-			data['hostIP'] = self.HostIP
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.Port instance
-		'''
-		return Port(Name=data.get('name', None),
-					HostPort=data.get('hostPort', None),
-					ContainerPort=data.get('containerPort', None),
-					Protocol=data.get('protocol', Protocol.ProtocolTCP),
-					HostIP=data.get('hostIP', None))
 
 class GCEPersistentDisk(object):
 	"""A Class representing the GCEPersistentDisk structure used by the kubernetes API
@@ -500,6 +374,13 @@ class GCEPersistentDisk(object):
 	GCEPersistentDisk.Readonly
 
 	"""
+	__slots__ = ('PDName', 'FSType', 'Partition', 'Readonly')
+	_FIELDS = (
+		_Value('PDName', 'pdName'),
+		_Value('FSType', 'fsType'),
+		_Value('Partition', 'partition'),
+		_Value('Readonly', 'readonly'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete GCEPersistentDisk.
 		
@@ -560,37 +441,7 @@ class GCEPersistentDisk(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.GCEPersistentDisk instance.
-
-		The return values uses the same key names as the JSON representation.
-
-		Returns:
-		  A dict representing this kubernetes.GCEPersistentDisk instance
-		'''
-		data = {}
-		if self.PDName:
-			data['pdName'] = self.PDName
-		if self.FSType:
-			data['fsType'] = self.FSType
-		if self.Partition:
-			data['partition'] = self.Partition
-		if self.Readonly:
-			data['readonly'] = self.Readonly
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.GCEPersistentDisk instance
-		'''
-		return GCEPersistentDisk(PDName=data.get('pdName', None),
-					FSType=data.get('fsType', None),
-					Partition=data.get('partition', None),
-					Readonly=data.get('readonly', None))
+_CompileModel(GCEPersistentDisk)
 
 
 class VolumeMount(object):
@@ -605,6 +456,12 @@ class VolumeMount(object):
 	VolumeMount.MountPath
 
 	"""
+	__slots__ = ('Name', 'Readonly', 'MountPath')
+	_FIELDS = (
+		_Value('Name', 'name'),
+		_Value('Readonly', 'readonly', False),
+		_Value('MountPath', 'mountPath'))
+
 	def __init__(self, **kwargs):
 		'''An object to hold a Kubernete VolumeMount.
 		
@@ -655,31 +512,5 @@ class VolumeMount(object):
 		'''
 		return simplejson.dumps(self.AsDict(), sort_keys=True)
 
-	def AsDict(self):
-		''' A dic representation of this kubernetes.VolumeMount instance.
-
-		The return values uses the same key names as the JSON representation.
+_CompileModel(VolumeMount)
 
-		Returns:
-		  A dict representing this kubernetes.VolumeMount instance
-		'''
-		data = {}
-		if self.Name:
-			data['name'] = self.Name
-		if self.Readonly:
-			data['readonly'] = self.Readonly
-		if self.MountPath:
-			data['mountPath'] = self.MountPath
-		return data
-
-	@staticmethod
-	def NewFromJsonDict(data):
-		'''Create a new instance base on a JSON dict
-		Args:
-		  data: A JSON dict, as converted from the JSON in the kubernetes API
-		Returns:
-		  A kubernetes.VolumeMount instance
-		'''
-		return VolumeMount(Name=data.get('name', None),
-					Readonly=data.get('readonly', False),
-					MountPath=data.get('mountPath', None))